@@ -0,0 +1,314 @@
+"""
+Batch entry point for scheduled runs, `python -m analytics --help`.
+
+Only the standard library is imported at module level. pandas, numpy and requests are
+imported inside the subcommands that need them so that short jobs and `--help` start fast,
+`bench-startup` keeps an eye on that.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+API_KEY_ENV = "ALPHA_VANTAGE_API_KEY"
+INTERVALS = ["daily", "1min", "5min", "15min", "30min", "60min"]
+
+
+def read_universe(args: argparse.Namespace) -> List[str]:
+
+    symbols = list(args.symbols or [])
+    if args.universe:
+        with open(args.universe) as universe_file:
+            symbols.extend(line.strip() for line in universe_file if line.strip())
+
+    assert (
+        symbols
+    ), "pass symbols with --symbols or a file with one symbol per line with --universe"
+    return symbols
+
+
+def cache_path(cache_dir: str, symbol: str, interval: str) -> Path:
+    return Path(cache_dir) / f"{symbol}_{interval}.csv"
+
+
+def load_cached(cache_dir: str, symbol: str, interval: str):
+    import pandas as pd
+
+    path = cache_path(cache_dir, symbol, interval)
+    assert path.exists(), f"no cached data for {symbol}, run `fetch` first - {path}"
+    return pd.read_csv(path, index_col=0, parse_dates=True)
+
+
+def write_output(result_df, output: Optional[str]):
+
+    if output:
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+        result_df.to_csv(output)
+        print(f"wrote {len(result_df)} rows to {output}")
+    else:
+        print(result_df.to_string())
+
+
+def fetch(args: argparse.Namespace) -> int:
+    from analytics.services.alpha_vantage import AVTimeseries
+    from analytics.services.alpha_vantage_utils import OutputSize, TimeInterval
+    from analytics.services.transport import (
+        RecordingTransport,
+        ReplayTransport,
+        RequestsTransport,
+    )
+
+    if args.replay:
+        transport = ReplayTransport(args.replay)
+    elif args.record:
+        transport = RecordingTransport(args.record, transport=RequestsTransport())
+    else:
+        transport = RequestsTransport()
+
+    api_key = args.api_key or os.environ.get(API_KEY_ENV, "")
+    assert api_key or args.replay, f"pass --api-key or set {API_KEY_ENV}"
+    av_obj = AVTimeseries(api_key=api_key, transport=transport)
+
+    Path(args.cache_dir).mkdir(parents=True, exist_ok=True)
+    for symbol in read_universe(args):
+        path = cache_path(args.cache_dir, symbol, args.interval)
+        if path.exists() and not args.refresh:
+            print(f"{symbol}: cached - {path}")
+            continue
+
+        if args.interval == "daily":
+            ticker_df = av_obj.get_daily_data(
+                symbol=symbol,
+                outputsize=OutputSize(args.outputsize),
+                adjusted=args.adjusted,
+            )
+        else:
+            ticker_df = av_obj.get_intraday_data(
+                symbol=symbol,
+                interval=TimeInterval(args.interval),
+                outputsize=OutputSize(args.outputsize),
+            )
+        ticker_df.to_csv(path)
+        print(f"{symbol}: fetched {len(ticker_df)} rows - {path}")
+
+    return 0
+
+
+def run(args: argparse.Namespace) -> int:
+    import pandas as pd
+
+    from analytics.strategies.utils import Trend
+
+    capture_trend = Trend(args.capture_trend)
+    results = {}
+    for symbol in read_universe(args):
+        ticker_df = load_cached(args.cache_dir, symbol, args.interval)
+
+        if args.strategy == "ma":
+            from analytics.strategies.ma_crossovers import MAStrategy
+
+            results[symbol] = MAStrategy.evaluate_ma_crossover(
+                ticker_df,
+                slow_ma=args.slow_ma,
+                fast_ma=args.fast_ma,
+                capture_trend=capture_trend,
+            )
+        elif args.strategy == "macd":
+            from analytics.strategies.macd_crossover import MACDCrossOverStrategy
+
+            results[symbol] = MACDCrossOverStrategy.evaluate_macd_crossover(
+                ticker_df,
+                slow_ma=args.slow_ma,
+                fast_ma=args.fast_ma,
+                signal_line_period=args.signal_line_period,
+                capture_trend=capture_trend,
+            )
+        else:
+            from analytics.strategies.rsi_strategy import RSIStrategy
+
+            results[symbol] = RSIStrategy.evaluate_rsi(
+                ticker_df,
+                span=args.span,
+                oversold=args.oversold,
+                overbought=args.overbought,
+                capture_trend=capture_trend,
+            )
+
+    # index level names carry the strategy parameters, the trend label is kept as a column
+    result_df = pd.concat(
+        {
+            symbol: returns_df.rename_axis(["session", "label"]).reset_index("label")
+            for symbol, returns_df in results.items()
+        },
+        names=["symbol"],
+    )
+    write_output(result_df, args.output)
+    return 0
+
+
+def sweep(args: argparse.Namespace) -> int:
+    import pandas as pd
+
+    from analytics.strategies.utils import Trend
+
+    capture_trend = Trend(args.capture_trend)
+    results = {}
+    for symbol in read_universe(args):
+        ticker_df = load_cached(args.cache_dir, symbol, args.interval)
+
+        if args.strategy == "ma":
+            from analytics.strategies.signal_strategy import SignalStrategy
+            from analytics.strategies.signals import SMA
+
+            # every pair shares the SMAs of a single compiled plan
+            signals = {
+                f"{slow_ma}_{fast_ma}": SMA(fast_ma) > SMA(slow_ma)
+                for slow_ma in args.slow_ma
+                for fast_ma in args.fast_ma
+                if slow_ma > fast_ma
+            }
+            session_returns = SignalStrategy.evaluate_signals(
+                ticker_df, signals, capture_trend=capture_trend
+            )
+            results[symbol] = pd.DataFrame(
+                {
+                    name: {
+                        "number_of_sessions": len(returns_df),
+                        "total_percent_returns": returns_df["percent_returns"].sum(),
+                        "mean_percent_returns": returns_df["percent_returns"].mean(),
+                        "win_rate": (returns_df["percent_returns"] > 0).mean(),
+                    }
+                    for name, returns_df in session_returns.items()
+                }
+            ).T.rename_axis("slow_fast")
+        else:
+            from analytics.strategies.rsi_strategy import RSIStrategy
+
+            thresholds = [
+                tuple(float(value) for value in threshold.split(":"))
+                for threshold in args.thresholds
+            ]
+            results[symbol] = RSIStrategy.sweep_rsi_thresholds(
+                ticker_df,
+                spans=args.spans,
+                thresholds=thresholds,
+                capture_trend=capture_trend,
+            )
+
+    write_output(pd.concat(results, names=["symbol"]), args.output)
+    return 0
+
+
+def bench_startup(args: argparse.Namespace) -> int:
+    """
+    cold start latency of `python -m analytics --help` in fresh interpreters.
+    """
+    command = [sys.executable, "-m", "analytics", "--help"]
+
+    timings = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    median_ms = statistics.median(timings)
+    print(
+        f"startup over {args.runs} runs - min {min(timings):.1f} ms, median {median_ms:.1f} ms"
+    )
+
+    if args.max_ms is not None and median_ms > args.max_ms:
+        print(f"median startup is above the {args.max_ms} ms budget")
+        return 1
+    return 0
+
+
+def add_universe_arguments(parser: argparse.ArgumentParser):
+
+    parser.add_argument("--symbols", nargs="+", help="ticker symbols")
+    parser.add_argument("--universe", help="file with one symbol per line")
+    parser.add_argument("--interval", choices=INTERVALS, default="daily")
+    parser.add_argument("--cache-dir", default="cache", help="where fetched data lives")
+
+
+def add_output_arguments(parser: argparse.ArgumentParser):
+
+    parser.add_argument(
+        "--capture-trend", choices=["all", "bullish", "bearish"], default="all"
+    )
+    parser.add_argument("--output", help="csv file to write, prints when missing")
+
+
+def build_parser() -> argparse.ArgumentParser:
+
+    parser = argparse.ArgumentParser(
+        prog="python -m analytics", description="Toucan batch runs"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    fetch_parser = subparsers.add_parser("fetch", help="download and cache ticker data")
+    add_universe_arguments(fetch_parser)
+    fetch_parser.add_argument("--api-key", help=f"defaults to ${API_KEY_ENV}")
+    fetch_parser.add_argument(
+        "--outputsize", choices=["compact", "full"], default="compact"
+    )
+    fetch_parser.add_argument(
+        "--unadjusted", dest="adjusted", action="store_false", help="daily data only"
+    )
+    fetch_parser.add_argument(
+        "--refresh", action="store_true", help="fetch even when cached"
+    )
+    transport_group = fetch_parser.add_mutually_exclusive_group()
+    transport_group.add_argument("--record", help="record responses to this directory")
+    transport_group.add_argument("--replay", help="serve responses from this directory")
+    fetch_parser.set_defaults(handler=fetch)
+
+    run_parser = subparsers.add_parser("run", help="run a strategy over a universe")
+    add_universe_arguments(run_parser)
+    run_parser.add_argument("--strategy", choices=["ma", "macd", "rsi"], default="ma")
+    run_parser.add_argument("--slow-ma", type=int, default=20)
+    run_parser.add_argument("--fast-ma", type=int, default=10)
+    run_parser.add_argument("--signal-line-period", type=int, default=9)
+    run_parser.add_argument("--span", type=int, default=14)
+    run_parser.add_argument("--oversold", type=float, default=30)
+    run_parser.add_argument("--overbought", type=float, default=70)
+    add_output_arguments(run_parser)
+    run_parser.set_defaults(handler=run)
+
+    sweep_parser = subparsers.add_parser(
+        "sweep", help="sweep strategy parameters over a universe"
+    )
+    add_universe_arguments(sweep_parser)
+    sweep_parser.add_argument("--strategy", choices=["ma", "rsi"], default="ma")
+    sweep_parser.add_argument("--slow-ma", type=int, nargs="+", default=[20, 50])
+    sweep_parser.add_argument("--fast-ma", type=int, nargs="+", default=[5, 10])
+    sweep_parser.add_argument("--spans", type=int, nargs="+", default=[7, 14])
+    sweep_parser.add_argument(
+        "--thresholds",
+        nargs="+",
+        default=["30:70", "40:60"],
+        help="oversold:overbought pairs",
+    )
+    add_output_arguments(sweep_parser)
+    sweep_parser.set_defaults(handler=sweep)
+
+    bench_parser = subparsers.add_parser(
+        "bench-startup", help="measure cold start latency of this CLI"
+    )
+    bench_parser.add_argument("--runs", type=int, default=10)
+    bench_parser.add_argument(
+        "--max-ms", type=float, help="fail when the median is above this budget"
+    )
+    bench_parser.set_defaults(handler=bench_startup)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
@@ -1,11 +1,10 @@
 import io
 import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd  # type: ignore
-import requests
 from requests.exceptions import HTTPError
 
 from analytics.services.alpha_vantage_utils import (
@@ -16,20 +15,35 @@ from analytics.services.alpha_vantage_utils import (
     TimeInterval,
     clean_column_names,
 )
+from analytics.services.transport import RequestsTransport, Transport
+from analytics.studies.data_definition import CompactOHLCV
 
 API_TIMEOUT = 30
 API_BASE_URL = "https://www.alphavantage.co/query"
+API_THROTTLE_SECONDS = 60
 
 
 class AVAbstract:
-    def __init__(self, api_key):
+    def __init__(
+        self,
+        api_key,
+        transport: Optional[Transport] = None,
+        base_url: str = API_BASE_URL,
+        throttle_seconds: float = API_THROTTLE_SECONDS,
+    ):
         self.api_key = api_key
+        self.transport = transport or RequestsTransport()
+        self.base_url = base_url
+        self.throttle_seconds = throttle_seconds
 
     @staticmethod
     def is_response_valid(response_json: Dict[str, Any]):
         is_valid = True
         if response_json.get("Error Message"):
             return False
+        # rate limited calls come back with a note instead of data
+        if response_json.get("Note"):
+            return False
         return is_valid
 
 
@@ -39,7 +53,8 @@ class AVTimeseries(AVAbstract):
         symbol: str,
         interval: TimeInterval,
         outputsize: OutputSize = OutputSize.COMPACT,
-    ) -> pd.DataFrame:
+        compact: bool = False,
+    ) -> Union[pd.DataFrame, CompactOHLCV]:
 
         query_params = QueryParams(
             apikey=self.api_key,
@@ -49,8 +64,8 @@ class AVTimeseries(AVAbstract):
             function=AVFunctions.INTRADAY.value,
         )
 
-        response = requests.get(
-            API_BASE_URL,
+        response = self.transport.get(
+            self.base_url,
             params=query_params,  # type: ignore
             timeout=API_TIMEOUT,
         )
@@ -69,6 +84,9 @@ class AVTimeseries(AVAbstract):
 
         result_df = result_df.astype(float)
 
+        if compact:
+            return CompactOHLCV.from_frame(result_df.sort_index())
+
         return result_df.sort_index()
 
     def get_intraday_data_extended(
@@ -102,7 +120,7 @@ class AVTimeseries(AVAbstract):
                 # is 5 calls per minute and 500 calls per day.
                 # Please visit https://www.alphavantage.co/premium/
                 # if you would like to target a higher API call frequency."\n}'
-                time.sleep(60)
+                time.sleep(self.throttle_seconds)
 
             if month > 12:
                 month = 1
@@ -113,8 +131,8 @@ class AVTimeseries(AVAbstract):
                 slice=f"year{year}month{month}",
             )
 
-            response = requests.get(
-                API_BASE_URL,
+            response = self.transport.get(
+                self.base_url,
                 params=query_params,  # type: ignore
                 timeout=API_TIMEOUT,
             )
@@ -137,7 +155,14 @@ class AVTimeseries(AVAbstract):
         outputsize: OutputSize = OutputSize.COMPACT,
         adjusted: bool = True,
         last_ten_years_only: bool = True,
-    ) -> pd.DataFrame:
+        compact: bool = False,
+    ) -> Union[pd.DataFrame, CompactOHLCV]:
+
+        if adjusted and compact:
+            # CompactOHLCV only holds raw OHLCV, the adjusted close would be dropped
+            raise ValueError(
+                "compact mode only supports raw daily data, pass adjusted=False"
+            )
 
         if adjusted:
             av_function: str = AVFunctions.DAILY_ADJUSTED
@@ -150,8 +175,8 @@ class AVTimeseries(AVAbstract):
             symbol=symbol,
             outputsize=outputsize.value,
         )
-        response = requests.get(
-            API_BASE_URL,
+        response = self.transport.get(
+            self.base_url,
             params=query_params,  # type: ignore
             timeout=API_TIMEOUT,
         )
@@ -175,6 +200,9 @@ class AVTimeseries(AVAbstract):
                 result_df.index > datetime.now() - timedelta(weeks=520)
             ]
 
+        if compact:
+            return CompactOHLCV.from_frame(result_df.sort_index())
+
         return result_df.sort_index()
 
     def get_symbol_search_results(self, search_keyword: str) -> pd.DataFrame:
@@ -185,7 +213,9 @@ class AVTimeseries(AVAbstract):
             keywords=search_keyword,
         )
 
-        response = requests.get(API_BASE_URL, params=query_params, timeout=API_TIMEOUT)
+        response = self.transport.get(
+            self.base_url, params=query_params, timeout=API_TIMEOUT
+        )
 
         response.raise_for_status()
 
@@ -222,7 +252,9 @@ class AVFundamental(AVAbstract):
         query_params = QueryParams(
             apikey=self.api_key, symbol=symbol, function=AVFunctions.BALANCE_SHEET.value
         )
-        response = requests.get(API_BASE_URL, params=query_params, timeout=API_TIMEOUT)
+        response = self.transport.get(
+            self.base_url, params=query_params, timeout=API_TIMEOUT
+        )
 
         response.raise_for_status()
 
@@ -241,7 +273,9 @@ class AVFundamental(AVAbstract):
             symbol=symbol,
             function=AVFunctions.INCOME_STATEMENT.value,
         )
-        response = requests.get(API_BASE_URL, params=query_params, timeout=API_TIMEOUT)
+        response = self.transport.get(
+            self.base_url, params=query_params, timeout=API_TIMEOUT
+        )
 
         response.raise_for_status()
 
@@ -258,7 +292,9 @@ class AVFundamental(AVAbstract):
         query_params = QueryParams(
             apikey=self.api_key, symbol=symbol, function=AVFunctions.EARNINGS.value
         )
-        response = requests.get(API_BASE_URL, params=query_params, timeout=API_TIMEOUT)
+        response = self.transport.get(
+            self.base_url, params=query_params, timeout=API_TIMEOUT
+        )
 
         response.raise_for_status()
 
@@ -279,7 +315,9 @@ class AVFundamental(AVAbstract):
         query_params = QueryParams(
             apikey=self.api_key, symbol=symbol, function=AVFunctions.CASH_FLOW.value
         )
-        response = requests.get(API_BASE_URL, params=query_params, timeout=API_TIMEOUT)
+        response = self.transport.get(
+            self.base_url, params=query_params, timeout=API_TIMEOUT
+        )
 
         response.raise_for_status()
 
@@ -296,7 +334,9 @@ class AVFundamental(AVAbstract):
         query_params = QueryParams(
             apikey=self.api_key, symbol=symbol, function=AVFunctions.OVERVIEW.value
         )
-        response = requests.get(API_BASE_URL, params=query_params, timeout=API_TIMEOUT)
+        response = self.transport.get(
+            self.base_url, params=query_params, timeout=API_TIMEOUT
+        )
 
         response.raise_for_status()
 
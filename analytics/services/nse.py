@@ -0,0 +1,33 @@
+import pandas as pd  # type: ignore
+
+NSE_COLUMNS = {
+    "Date": "date",
+    "Open Price": "open",
+    "High Price": "high",
+    "Low Price": "low",
+    "Close Price": "close",
+    "Total Traded Quantity": "volume",
+}
+
+
+def read_nse_csv(path: str) -> pd.DataFrame:
+    """
+    read an NSE security-wise price volume csv (e.g. data/*EQN.csv) into an OHLCV frame
+    indexed by date. Prices are unadjusted.
+    """
+    nse_df = pd.read_csv(path, thousands=",")
+    nse_df.columns = [column.strip() for column in nse_df.columns]
+
+    expected_columns = set(NSE_COLUMNS)
+    assert expected_columns.issubset(
+        nse_df.columns
+    ), f"Expecting columns {expected_columns}. Received {nse_df.columns}"
+
+    ticker_df = nse_df[list(NSE_COLUMNS)].rename(columns=NSE_COLUMNS)
+    ticker_df = ticker_df.set_index(
+        pd.to_datetime(ticker_df["date"], format="%d-%b-%Y")
+    )
+    ticker_df = ticker_df.drop(columns="date").astype(float)
+    ticker_df.index.name = None
+
+    return ticker_df.sort_index()
@@ -0,0 +1,234 @@
+"""
+Pluggable HTTP transports for the Alpha Vantage client.
+
+- `RequestsTransport` talks to the real API (the default).
+- `RecordingTransport` wraps another transport and stores every response as a gzip
+  compressed fixture.
+- `ReplayTransport` serves recorded fixtures in process, with optional latency and
+  Alpha Vantage style rate limiting.
+- `FixtureServer` exposes a `ReplayTransport` over local HTTP for benchmarks that should
+  include the network stack, point the client at it with `base_url=server.url`.
+"""
+
+import gzip
+import hashlib
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Deque, Dict, Optional, Union
+from urllib.parse import parse_qsl, urlparse
+
+import requests
+from requests.exceptions import HTTPError
+
+RATE_LIMIT_NOTE = (
+    "Thank you for using Alpha Vantage! Our standard API call frequency is 5 calls per "
+    "minute and 500 calls per day."
+)
+IGNORED_PARAMS = {"apikey"}
+# Alpha Vantage answers throttled or invalid calls with a 200 and one of these keys
+ERROR_KEYS = {"Note", "Error Message"}
+
+
+@dataclass
+class FixtureResponse:
+    """
+    the subset of `requests.Response` used by the client.
+    """
+
+    status_code: int
+    content: bytes
+    url: str = ""
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise HTTPError(f"{self.status_code} Error for url: {self.url}")
+
+
+class Transport(ABC):
+    @abstractmethod
+    def get(self, url: str, params: Dict[str, Any], timeout: float): ...
+
+
+class RequestsTransport(Transport):
+    def get(self, url: str, params: Dict[str, Any], timeout: float):
+        return requests.get(url, params=params, timeout=timeout)
+
+
+def fixture_name(params: Dict[str, Any]) -> str:
+    """
+    file name of a recorded response, the api key is never part of it.
+    """
+    key_params = {
+        key: str(value) for key, value in params.items() if key not in IGNORED_PARAMS
+    }
+    digest = hashlib.sha1(
+        json.dumps(key_params, sort_keys=True).encode("utf-8")
+    ).hexdigest()[:12]
+    label = "_".join(
+        str(key_params[key]) for key in ["function", "symbol"] if key in key_params
+    )
+    return f"{label}_{digest}.json.gz"
+
+
+def is_recordable(response) -> bool:
+    """
+    only successful responses are recorded, so that a throttled call never replaces a
+    good fixture.
+    """
+    if response.status_code >= 400:
+        return False
+    try:
+        payload = json.loads(response.content)
+    except ValueError:
+        # csv responses
+        return True
+    return not (isinstance(payload, dict) and ERROR_KEYS.intersection(payload))
+
+
+@dataclass
+class RecordingTransport(Transport):
+
+    fixtures_dir: Union[str, Path]
+    transport: Transport = field(default_factory=RequestsTransport)
+
+    def __post_init__(self):
+        self.fixtures_dir = Path(self.fixtures_dir)
+        self.fixtures_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, url: str, params: Dict[str, Any], timeout: float):
+
+        response = self.transport.get(url, params=params, timeout=timeout)
+        if not is_recordable(response):
+            return response
+
+        fixture = {
+            "params": {
+                key: value for key, value in params.items() if key not in IGNORED_PARAMS
+            },
+            "status_code": response.status_code,
+            "content": response.content.decode("utf-8"),
+        }
+        with gzip.open(self.fixtures_dir / fixture_name(params), "wt") as fixture_file:
+            json.dump(fixture, fixture_file)
+
+        return response
+
+
+@dataclass
+class ReplayTransport(Transport):
+    """
+    serves recorded fixtures without any network access.
+
+    `latency` seconds are spent on every call. When `calls_per_minute` is set, calls over
+    the limit get the `Note` payload Alpha Vantage answers with instead of the fixture.
+    """
+
+    fixtures_dir: Union[str, Path]
+    latency: float = 0.0
+    calls_per_minute: Optional[int] = None
+
+    call_times: Deque[float] = field(default_factory=deque, init=False)
+
+    def __post_init__(self):
+        self.fixtures_dir = Path(self.fixtures_dir)
+        self.lock = threading.Lock()
+
+    def is_rate_limited(self) -> bool:
+
+        if self.calls_per_minute is None:
+            return False
+
+        with self.lock:
+            now = time.monotonic()
+            while self.call_times and now - self.call_times[0] >= 60:
+                self.call_times.popleft()
+            if len(self.call_times) >= self.calls_per_minute:
+                return True
+            self.call_times.append(now)
+            return False
+
+    def get(self, url: str, params: Dict[str, Any], timeout: float = None):
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        if self.is_rate_limited():
+            return FixtureResponse(
+                status_code=200,
+                content=json.dumps({"Note": RATE_LIMIT_NOTE}).encode("utf-8"),
+                url=url,
+            )
+
+        fixture_path = self.fixtures_dir / fixture_name(params)
+        if not fixture_path.exists():
+            return FixtureResponse(
+                status_code=404,
+                content=json.dumps({"Error Message": "no recorded fixture"}).encode(
+                    "utf-8"
+                ),
+                url=f"{url} ({fixture_path.name})",
+            )
+
+        with gzip.open(fixture_path, "rt") as fixture_file:
+            fixture = json.load(fixture_file)
+
+        return FixtureResponse(
+            status_code=fixture["status_code"],
+            content=fixture["content"].encode("utf-8"),
+            url=url,
+        )
+
+
+class FixtureServer:
+    """
+    local stand-in for the Alpha Vantage API backed by a `ReplayTransport`.
+
+        with FixtureServer(ReplayTransport("fixtures")) as server:
+            AVTimeseries(api_key="demo", base_url=server.url).get_daily_data("IBM")
+    """
+
+    def __init__(
+        self, transport: ReplayTransport, host: str = "127.0.0.1", port: int = 0
+    ):
+
+        class ReplayHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                params = dict(parse_qsl(urlparse(self.path).query))
+                response = transport.get(self.path, params=params)
+
+                self.send_response(response.status_code)
+                self.send_header("Content-Length", str(len(response.content)))
+                self.end_headers()
+                self.wfile.write(response.content)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), ReplayHandler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/query"
+
+    def __enter__(self) -> "FixtureServer":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.httpd.shutdown()
+        self.httpd.server_close()
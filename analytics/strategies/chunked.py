@@ -0,0 +1,322 @@
+"""
+Out-of-core evaluation of the crossover strategies.
+
+Bars are streamed in fixed size chunks, indicators carry their warm up state and the
+session that is still open at the end of a chunk is carried into the next one. Only
+completed sessions are kept in memory.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Optional, Union
+
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+
+from analytics.strategies.utils import Trend, session_percent_returns
+from analytics.studies.data_definition import CompactOHLCV, TickerData
+from analytics.studies.moving_averages import MAModels
+from analytics.studies.streaming import StreamingEMA, StreamingMACD, StreamingSMA
+
+
+def read_csv_chunks(path: str, chunksize: int = 100000, **kwargs) -> Iterator:
+    """
+    stream an OHLCV csv from disk, `kwargs` are passed on to `pd.read_csv`.
+    """
+    return pd.read_csv(path, chunksize=chunksize, **kwargs)
+
+
+@dataclass
+class OpenSession:
+
+    session_id: int
+    is_bullish: bool
+    start_ts: object
+    start_open: float
+    start_close: float
+    n_rows: int
+
+
+@dataclass
+class SessionAccumulator:
+    """
+    collects completed sessions chunk by chunk, priced with the same
+    `session_percent_returns` as the in-memory strategies.
+    """
+
+    session_column: str
+    label_column: str
+    count_rows: bool = False
+
+    open_session: Optional[OpenSession] = field(default=None, init=False)
+    completed: List[pd.DataFrame] = field(default_factory=list, init=False)
+
+    # last bar seen, closes sessions which end right at a chunk boundary
+    last_signal: Optional[bool] = field(default=None, init=False)
+    last_ts: object = field(default=None, init=False)
+    last_open: float = field(default=np.nan, init=False)
+    last_close: float = field(default=np.nan, init=False)
+
+    def completed_sessions(
+        self,
+        session_ids: np.ndarray,
+        is_bullish: np.ndarray,
+        start_open: np.ndarray,
+        start_close: np.ndarray,
+        end_open: np.ndarray,
+        end_close: np.ndarray,
+        start_ts: np.ndarray,
+        end_ts: np.ndarray,
+        n_rows: np.ndarray,
+    ) -> pd.DataFrame:
+
+        sessions = {
+            "percent_returns": session_percent_returns(
+                is_bullish=is_bullish,
+                start_open=start_open,
+                start_close=start_close,
+                end_open=end_open,
+                end_close=end_close,
+            ),
+            "session_details": [
+                f"{start}-{end}" for start, end in zip(start_ts, end_ts)
+            ],
+        }
+        if self.count_rows:
+            sessions["number_of_sessions"] = n_rows
+
+        return pd.DataFrame(
+            sessions,
+            index=pd.MultiIndex.from_arrays(
+                [
+                    session_ids,
+                    np.where(is_bullish, Trend.BULLISH.value, Trend.BEARISH.value),
+                ],
+                names=[self.session_column, self.label_column],
+            ),
+        )
+
+    def update(self, signal: np.ndarray, chunk_df: pd.DataFrame):
+
+        n_rows = len(signal)
+        if not n_rows:
+            return
+
+        open_prices = chunk_df["open"].values.astype(float)
+        close_prices = chunk_df["close"].values.astype(float)
+        index = chunk_df.index
+
+        # rows where a new session starts within this chunk
+        starts = np.flatnonzero(signal[1:] != signal[:-1]) + 1
+        if self.last_signal is None or signal[0] != self.last_signal:
+            starts = np.concatenate([[0], starts])
+
+        if len(starts):
+            carried = self.open_session
+            if carried is not None:
+                end = starts[0] - 1
+                self.completed.append(
+                    self.completed_sessions(
+                        session_ids=np.array([carried.session_id]),
+                        is_bullish=np.array([carried.is_bullish]),
+                        start_open=np.array([carried.start_open]),
+                        start_close=np.array([carried.start_close]),
+                        end_open=np.array(
+                            [open_prices[end] if end >= 0 else self.last_open]
+                        ),
+                        end_close=np.array(
+                            [close_prices[end] if end >= 0 else self.last_close]
+                        ),
+                        start_ts=[carried.start_ts],
+                        end_ts=[index[end] if end >= 0 else self.last_ts],
+                        n_rows=np.array([carried.n_rows + starts[0]]),
+                    )
+                )
+                first_id = carried.session_id + 1
+            else:
+                first_id = 0
+
+            # sessions which start and end within this chunk
+            session_starts, session_ends = starts[:-1], starts[1:] - 1
+            if len(session_starts):
+                self.completed.append(
+                    self.completed_sessions(
+                        session_ids=first_id + np.arange(len(session_starts)),
+                        is_bullish=signal[session_starts],
+                        start_open=open_prices[session_starts],
+                        start_close=close_prices[session_starts],
+                        end_open=open_prices[session_ends],
+                        end_close=close_prices[session_ends],
+                        start_ts=index[session_starts],
+                        end_ts=index[session_ends],
+                        n_rows=session_ends - session_starts + 1,
+                    )
+                )
+
+            last_start = starts[-1]
+            self.open_session = OpenSession(
+                session_id=first_id + len(session_starts),
+                is_bullish=bool(signal[last_start]),
+                start_ts=index[last_start],
+                start_open=open_prices[last_start],
+                start_close=close_prices[last_start],
+                n_rows=n_rows - last_start,
+            )
+        else:
+            self.open_session.n_rows += n_rows
+
+        self.last_signal = bool(signal[-1])
+        self.last_ts = index[-1]
+        self.last_open = open_prices[-1]
+        self.last_close = close_prices[-1]
+
+    def finish(self, capture_trend: Trend = Trend.ALL) -> pd.DataFrame:
+
+        sessions = list(self.completed)
+        carried = self.open_session
+        if carried is not None:
+            sessions.append(
+                self.completed_sessions(
+                    session_ids=np.array([carried.session_id]),
+                    is_bullish=np.array([carried.is_bullish]),
+                    start_open=np.array([carried.start_open]),
+                    start_close=np.array([carried.start_close]),
+                    end_open=np.array([self.last_open]),
+                    end_close=np.array([self.last_close]),
+                    start_ts=[carried.start_ts],
+                    end_ts=[self.last_ts],
+                    n_rows=np.array([carried.n_rows]),
+                )
+            )
+
+        aggregated_returns = pd.concat(sessions)
+
+        # Filter results for ease of decision making.
+        if capture_trend in [Trend.BULLISH, Trend.BEARISH]:
+            aggregated_returns = aggregated_returns.loc[
+                aggregated_returns.index.get_level_values(self.label_column)
+                == capture_trend.value
+            ]
+
+        return aggregated_returns
+
+
+class ChunkedCrossoverStrategy(ABC):
+    """
+    base class for chunked strategies, subclasses turn a chunk into a crossover signal.
+    """
+
+    session_column: str
+    label_column: str
+    count_rows: bool = False
+
+    @abstractmethod
+    def crossover_signal(self, chunk_df: pd.DataFrame) -> np.ndarray: ...
+
+    def evaluate_chunks(
+        self,
+        chunks: Iterable[Union[pd.DataFrame, CompactOHLCV]],
+        capture_trend: Trend = Trend.ALL,
+    ) -> pd.DataFrame:
+
+        accumulator = SessionAccumulator(
+            session_column=self.session_column,
+            label_column=self.label_column,
+            count_rows=self.count_rows,
+        )
+        for chunk in chunks:
+            chunk_df = TickerData(ticker_df=chunk).ticker_df
+            accumulator.update(self.crossover_signal(chunk_df), chunk_df)
+
+        assert accumulator.open_session is not None, "no bars were streamed"
+        return accumulator.finish(capture_trend=capture_trend)
+
+
+@dataclass
+class ChunkedMAStrategy(ChunkedCrossoverStrategy):
+
+    slow_ma: int
+    fast_ma: int
+    ma_model: MAModels = MAModels.SMA
+
+    def __post_init__(self):
+
+        # sanity check to ensure that slow_ma is greater than faster_ma
+        assert (
+            self.slow_ma > self.fast_ma
+        ), f"slow ma should be greater than fast ma- received - slow_ma - {self.slow_ma}, fast_ma-{self.fast_ma}"
+
+        column_suffix = f"{self.slow_ma}_{self.fast_ma}"
+        self.session_column = f"ma_session_{column_suffix}"
+        self.label_column = f"label_{column_suffix}"
+
+        if self.ma_model == MAModels.SMA:
+            self.slow_average = StreamingSMA(self.slow_ma)
+            self.fast_average = StreamingSMA(self.fast_ma)
+        else:
+            assert self.ma_model == MAModels.EWMA
+            self.slow_average = StreamingEMA(self.slow_ma)
+            self.fast_average = StreamingEMA(self.fast_ma)
+
+    def crossover_signal(self, chunk_df: pd.DataFrame) -> np.ndarray:
+        close_prices = chunk_df["close"].values.astype(float)
+        return self.fast_average.update(close_prices) > self.slow_average.update(
+            close_prices
+        )
+
+    @classmethod
+    def evaluate_ma_crossover(
+        cls,
+        chunks: Iterable[Union[pd.DataFrame, CompactOHLCV]],
+        slow_ma: int = 20,
+        fast_ma: int = 10,
+        capture_trend: Trend = Trend.ALL,
+        ma_model: MAModels = MAModels.SMA,
+    ) -> pd.DataFrame:
+        """
+        chunked `MAStrategy.evaluate_ma_crossover`.
+        """
+        return cls(slow_ma=slow_ma, fast_ma=fast_ma, ma_model=ma_model).evaluate_chunks(
+            chunks, capture_trend=capture_trend
+        )
+
+
+@dataclass
+class ChunkedMACDStrategy(ChunkedCrossoverStrategy):
+
+    slow_ma: int
+    fast_ma: int
+    signal_line_period: int
+
+    session_column = "macd_session"
+    label_column = "label_macd"
+    count_rows = True
+
+    def __post_init__(self):
+        self.macd = StreamingMACD(
+            slow_ma=self.slow_ma,
+            fast_ma=self.fast_ma,
+            signal_line_period=self.signal_line_period,
+        )
+
+    def crossover_signal(self, chunk_df: pd.DataFrame) -> np.ndarray:
+        macd_line, macd_signal = self.macd.update(
+            chunk_df["close"].values.astype(float)
+        )
+        return macd_line > macd_signal
+
+    @classmethod
+    def evaluate_macd_crossover(
+        cls,
+        chunks: Iterable[Union[pd.DataFrame, CompactOHLCV]],
+        slow_ma: int,
+        fast_ma: int,
+        signal_line_period: int,
+        capture_trend: Trend = Trend.ALL,
+    ) -> pd.DataFrame:
+        """
+        chunked `MACDCrossOverStrategy.evaluate_macd_crossover`.
+        """
+        return cls(
+            slow_ma=slow_ma, fast_ma=fast_ma, signal_line_period=signal_line_period
+        ).evaluate_chunks(chunks, capture_trend=capture_trend)
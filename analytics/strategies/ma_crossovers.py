@@ -1,11 +1,11 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import List
+from typing import List, Union
 
-import numpy as np  # type: ignore
 import pandas as pd  # type: ignore
 
-from analytics.strategies.utils import Trend
+from analytics.strategies.utils import Trend, label_sessions, session_ids
+from analytics.studies.data_definition import CompactOHLCV
 from analytics.studies.moving_averages import MAModels, MovingAverages
 
 
@@ -17,6 +17,7 @@ class MAStrategy(MovingAverages):
     ma_model: MAModels = MAModels.SMA
 
     def __post_init__(self):
+        super().__post_init__()
 
         # sanity check to ensure that slow_ma is greater than faster_ma
         assert (
@@ -52,19 +53,13 @@ class MAStrategy(MovingAverages):
 
         # Next we need to create sesssions. A sessions last as long as the faster moving average does not cross
         # above or below the slower moving average.
-        # We use EX-OR truth table to identify change overs.
-        ma_df[f"ma_session_{self.column_suffix}"] = (
-            (
-                ma_df[f"ma_signal_{self.column_suffix}"]
-                ^ ma_df[f"ma_signal_{self.column_suffix}"].shift(1)
-            )
-            .fillna(False)
-            .cumsum(skipna=False)
+        ma_df[f"ma_session_{self.column_suffix}"] = session_ids(
+            ma_df[f"ma_signal_{self.column_suffix}"], compact=self.compact
         )
 
         # annotate session as either bullish or bearish
-        ma_df[f"label_{self.column_suffix}"] = np.where(
-            ma_df[f"ma_signal_{self.column_suffix}"] == 1, "bullish", "bearish"
+        ma_df[f"label_{self.column_suffix}"] = label_sessions(
+            ma_df[f"ma_signal_{self.column_suffix}"], compact=self.compact
         )
         return ma_df
 
@@ -93,7 +88,7 @@ class MAStrategy(MovingAverages):
     @classmethod
     def evaluate_ma_crossover(
         cls,
-        ticker_df: pd.DataFrame,
+        ticker_df: Union[pd.DataFrame, CompactOHLCV],
         slow_ma: int = 20,
         fast_ma: int = 10,
         capture_trend: Trend = Trend.ALL,
@@ -115,7 +110,9 @@ class MAStrategy(MovingAverages):
         column_suffix = f"{slow_ma}_{fast_ma}"
         # aggregate session to compute estimated returns per session.
         aggregated_returns = scrip_ma_sessions.groupby(
-            [f"ma_session_{column_suffix}", f"label_{column_suffix}"], as_index=True
+            [f"ma_session_{column_suffix}", f"label_{column_suffix}"],
+            as_index=True,
+            observed=True,
         ).apply(MAStrategy.compute_returns, slow_ma=slow_ma, fast_ma=fast_ma)
 
         # Filter results for ease of decision making.
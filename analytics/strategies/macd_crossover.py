@@ -1,11 +1,11 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import List
+from typing import Union
 
-import numpy as np  # type: ignore
 import pandas as pd  # type: ignore
 
-from analytics.strategies.utils import Trend
+from analytics.strategies.utils import Trend, label_sessions, session_ids
+from analytics.studies.data_definition import CompactOHLCV
 from analytics.studies.macd import MACD
 
 
@@ -21,16 +21,13 @@ class MACDCrossOverStrategy(MACD):
 
         # Next we need to create sesssions. A sessions last as long as the macd_line does not cross
         # above or below the macd_signal line.
-        # We use EX-OR truth table to identify change overs.
-        macd_df[f"macd_session"] = (
-            (macd_df["macd_crosover_signal"] ^ macd_df["macd_crosover_signal"].shift(1))
-            .fillna(False)
-            .cumsum(skipna=False)
+        macd_df[f"macd_session"] = session_ids(
+            macd_df["macd_crosover_signal"], compact=self.compact
         )
 
         # annotate session as either bullish or bearish
-        macd_df[f"label_macd"] = np.where(
-            macd_df["macd_crosover_signal"] == 1, "bullish", "bearish"
+        macd_df[f"label_macd"] = label_sessions(
+            macd_df["macd_crosover_signal"], compact=self.compact
         )
         return macd_df
 
@@ -65,7 +62,7 @@ class MACDCrossOverStrategy(MACD):
     @classmethod
     def evaluate_macd_crossover(
         cls,
-        ticker_df: pd.DataFrame,
+        ticker_df: Union[pd.DataFrame, CompactOHLCV],
         slow_ma: int,
         fast_ma: int,
         signal_line_period: int,
@@ -89,7 +86,7 @@ class MACDCrossOverStrategy(MACD):
 
         # aggregate session to compute estimated returns per session.
         aggregated_returns = ticker_macd_sessions.groupby(
-            [f"macd_session", f"label_macd"], as_index=True
+            [f"macd_session", f"label_macd"], as_index=True, observed=True
         ).apply(MACDCrossOverStrategy.compute_returns)
 
         # Filter results for ease of decision making.
@@ -0,0 +1,203 @@
+"""
+Cross-sectional ranking and top-N portfolio rebalancing.
+
+Prices are a wide (time x symbol) close frame, or a (symbol, date) panel which is unstacked
+into one. Scores are computed for every symbol at once, the universe is ranked at every
+rebalance date and the portfolio drifts with prices in between.
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import NamedTuple, Optional
+
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+
+from analytics.studies.macd import MACD
+from analytics.studies.moving_averages import MovingAverages
+from analytics.studies.rsi import RSI, RSIMethod
+
+
+class RankingScore(Enum):
+    RSI: str = "rsi"
+    MACD_HISTOGRAM: str = "macd_histogram"
+    MA_DISTANCE: str = "ma_distance"
+
+
+class RebalanceFrequency(Enum):
+    DAILY: str = "D"
+    WEEKLY: str = "W"
+    MONTHLY: str = "M"
+    QUARTERLY: str = "Q"
+
+
+class PortfolioResponse(NamedTuple):
+
+    equity_curve: pd.Series
+    weights: pd.DataFrame
+    turnover: pd.Series
+
+
+def wide_close_prices(prices: pd.DataFrame) -> pd.DataFrame:
+    """
+    (time x symbol) close prices from either a wide frame or a (symbol, date) panel.
+    """
+    if isinstance(prices.index, pd.MultiIndex):
+        return prices["close"].unstack("symbol").astype(float)
+    return prices.astype(float)
+
+
+@dataclass
+class CrossSectionalStrategy:
+
+    score: RankingScore = RankingScore.RSI
+    top_n: int = 10
+    frequency: RebalanceFrequency = RebalanceFrequency.MONTHLY
+    rebalance_every: Optional[int] = None
+    cost_bps: float = 10.0
+    ascending: bool = False
+
+    # study parameters
+    rsi_span: int = 14
+    rsi_method: RSIMethod = RSIMethod.WILDER
+    slow_ma: int = 26
+    fast_ma: int = 12
+    signal_line_period: int = 9
+    ma_period: int = 200
+
+    def __post_init__(self):
+        assert self.top_n > 0, f"top_n should be positive, received - {self.top_n}"
+
+    def compute_scores(self, close_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        scores for every (time, symbol), computed with the RSI, MACD and MovingAverages
+        study helpers on all columns at once. MACD histogram and MA distance are relative to the close so
+        that they are comparable across symbols.
+        """
+        if self.score == RankingScore.RSI:
+            scores = RSI.rsi_from_delta(
+                close_df.diff(), span=self.rsi_span, method=self.rsi_method
+            )
+        elif self.score == RankingScore.MACD_HISTOGRAM:
+            macd_line, macd_signal = MACD.macd_lines(
+                close_df,
+                slow_ma=self.slow_ma,
+                fast_ma=self.fast_ma,
+                signal_line_period=self.signal_line_period,
+            )
+            scores = (macd_line - macd_signal) / close_df
+        elif self.score == RankingScore.MA_DISTANCE:
+            scores = close_df / MovingAverages.sma(close_df, self.ma_period) - 1
+        else:
+            raise ValueError(f"Score {self.score} not supported")
+
+        # symbols without a price cannot be traded
+        return scores.where(close_df.notna())
+
+    def rebalance_rows(self, index: pd.Index) -> np.ndarray:
+        """
+        positions of the last bar of every rebalance period.
+        """
+        if self.rebalance_every is not None:
+            return np.arange(self.rebalance_every - 1, len(index), self.rebalance_every)
+
+        assert isinstance(
+            index, pd.DatetimeIndex
+        ), "calendar rebalance frequencies need a DatetimeIndex, use rebalance_every instead"
+        periods = index.to_period(self.frequency.value)
+        is_period_end = np.append(periods[1:] != periods[:-1], True)
+        return np.flatnonzero(is_period_end)
+
+    def select_top_n(self, scores: np.ndarray) -> np.ndarray:
+        """
+        equal weights over the top N symbols of every row of a (rebalance x symbol) score matrix.
+        """
+        n_symbols = scores.shape[1]
+        top_n = min(self.top_n, n_symbols)
+
+        ranked_scores = -scores if self.ascending else scores
+        ranked_scores = np.where(np.isnan(ranked_scores), -np.inf, ranked_scores)
+
+        top_idx = np.argpartition(-ranked_scores, top_n - 1, axis=1)[:, :top_n]
+        is_valid = np.isfinite(np.take_along_axis(ranked_scores, top_idx, axis=1))
+        n_valid = is_valid.sum(axis=1, keepdims=True)
+
+        weights = np.zeros_like(scores, dtype=float)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            np.put_along_axis(
+                weights, top_idx, np.where(is_valid, 1 / n_valid, 0.0), axis=1
+            )
+        return weights
+
+    def backtest(self, prices: pd.DataFrame) -> PortfolioResponse:
+
+        close_df = wide_close_prices(prices)
+        close_prices = close_df.values
+        n_rows = len(close_df)
+
+        rows = self.rebalance_rows(close_df.index)
+        weights = self.select_top_n(self.compute_scores(close_df).values[rows])
+
+        # cumulative growth of every symbol, missing prices are flat
+        bar_returns = np.nan_to_num(close_prices[1:] / close_prices[:-1] - 1)
+        growth = np.vstack(
+            [np.ones(close_prices.shape[1]), np.cumprod(1 + bar_returns, axis=0)]
+        )
+
+        # holdings bought at the close of a rebalance row drift with prices until the next one.
+        # `units` are holdings per unit of equity, the appended row is the all cash segment
+        # before the first rebalance.
+        units = np.zeros((len(rows) + 1, close_prices.shape[1]))
+        np.divide(weights, growth[rows], out=units[:-1], where=weights > 0)
+        cash = np.append(1 - weights.sum(axis=1), 1.0)
+
+        segment = np.searchsorted(rows, np.arange(n_rows), side="left") - 1
+        segment_growth = cash[segment] + np.einsum("ij,ij->i", growth, units[segment])
+
+        # turnover against the drifted weights right before every rebalance
+        drifted = np.zeros_like(weights)
+        if len(rows) > 1:
+            drifted[1:] = units[:-2] * growth[rows[1:]] / segment_growth[rows[1:], None]
+        turnover = np.abs(weights - drifted).sum(axis=1)
+        costs = turnover * self.cost_bps / 10000
+
+        # equity right after every rebalance, the growth of the previous segment times costs
+        period_growth = np.append(1.0, segment_growth[rows[1:]]) * (1 - costs)
+        rebalance_equity = np.append(np.cumprod(period_growth), 1.0)
+
+        equity_curve = rebalance_equity[segment] * segment_growth
+
+        rebalance_index = close_df.index[rows]
+        return PortfolioResponse(
+            equity_curve=pd.Series(equity_curve, index=close_df.index, name="equity"),
+            weights=pd.DataFrame(
+                weights, index=rebalance_index, columns=close_df.columns
+            ),
+            turnover=pd.Series(turnover, index=rebalance_index, name="turnover"),
+        )
+
+    @classmethod
+    def evaluate_portfolio(
+        cls,
+        prices: pd.DataFrame,
+        score: RankingScore = RankingScore.RSI,
+        top_n: int = 10,
+        frequency: RebalanceFrequency = RebalanceFrequency.MONTHLY,
+        cost_bps: float = 10.0,
+        ascending: bool = False,
+        **study_params,
+    ) -> PortfolioResponse:
+        """
+        1. computes the ranking score for the whole universe
+        2. picks the top N symbols at every rebalance date
+        3. drifts holdings with prices and charges turnover costs to build the equity curve.
+        """
+        strategy = cls(
+            score=score,
+            top_n=top_n,
+            frequency=frequency,
+            cost_bps=cost_bps,
+            ascending=ascending,
+            **study_params,
+        )
+        return strategy.backtest(prices)
@@ -0,0 +1,305 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, List, Optional, Tuple, Union
+
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+
+from analytics.strategies.utils import Trend, state_session_returns
+from analytics.studies.data_definition import CompactOHLCV, TickerData
+from analytics.studies.macd import MACD
+from analytics.studies.moving_averages import MAModels, MovingAverages
+
+
+class ResampleMethod(Enum):
+    SHUFFLE: str = "shuffle"
+    BOOTSTRAP: str = "bootstrap"
+
+
+@dataclass
+class MACrossoverSignal:
+    """
+    MA crossover signal for a (time x path) matrix of close prices, mirrors `MAStrategy`.
+    """
+
+    slow_ma: int = 20
+    fast_ma: int = 10
+    ma_model: MAModels = MAModels.SMA
+
+    def moving_average(self, close_df: pd.DataFrame, n: int) -> pd.DataFrame:
+        if self.ma_model == MAModels.SMA:
+            return MovingAverages.sma(close_df, n).fillna(close_df)
+        assert self.ma_model == MAModels.EWMA
+        return MovingAverages.ema(close_df, n)
+
+    def __call__(self, close_prices: np.ndarray) -> np.ndarray:
+        close_df = pd.DataFrame(close_prices)
+        return (
+            self.moving_average(close_df, self.fast_ma).values
+            > self.moving_average(close_df, self.slow_ma).values
+        )
+
+
+@dataclass
+class MACDCrossoverSignal:
+    """
+    MACD crossover signal for a (time x path) matrix of close prices, mirrors `MACDCrossOverStrategy`.
+    """
+
+    slow_ma: int = 26
+    fast_ma: int = 12
+    signal_line_period: int = 9
+
+    def __call__(self, close_prices: np.ndarray) -> np.ndarray:
+        macd_line, macd_signal = MACD.macd_lines(
+            pd.DataFrame(close_prices),
+            slow_ma=self.slow_ma,
+            fast_ma=self.fast_ma,
+            signal_line_period=self.signal_line_period,
+        )
+        return macd_line.values > macd_signal.values
+
+
+def padded_session_returns(
+    combination: np.ndarray, percent_returns: np.ndarray, n_paths: int
+) -> np.ndarray:
+    """
+    (path x session) matrix of session returns, padded with NaN.
+
+    `combination` must be sorted, as returned by `state_session_returns`.
+    """
+    n_sessions = np.bincount(combination, minlength=n_paths)
+    offsets = np.cumsum(n_sessions) - n_sessions
+    position = np.arange(len(combination)) - offsets[combination]
+
+    returns_matrix = np.full((n_paths, n_sessions.max(initial=0)), np.nan)
+    returns_matrix[combination, position] = percent_returns
+    return returns_matrix
+
+
+def summarize_session_returns(returns_matrix: np.ndarray) -> pd.DataFrame:
+    """
+    compounded return, max drawdown and win rate for every row of a NaN padded
+    (resample x session) matrix of percent returns.
+    """
+    is_session = ~np.isnan(returns_matrix)
+    growth = np.where(is_session, 1 + returns_matrix / 100, 1)
+
+    equity = np.cumprod(growth, axis=1)
+    peak = np.maximum(np.maximum.accumulate(equity, axis=1), 1)
+    drawdown = equity / peak - 1
+
+    n_sessions = is_session.sum(axis=1)
+    n_wins = (is_session & (np.nan_to_num(returns_matrix) > 0)).sum(axis=1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return pd.DataFrame(
+            {
+                "compounded_percent_returns": (growth.prod(axis=1) - 1) * 100,
+                "max_drawdown_percent": drawdown.min(axis=1, initial=0) * 100,
+                "win_rate": n_wins / n_sessions,
+                "number_of_sessions": n_sessions,
+            }
+        )
+
+
+def resample_returns(
+    percent_returns: np.ndarray,
+    n_resamples: int,
+    rng: np.random.Generator,
+    method: ResampleMethod = ResampleMethod.SHUFFLE,
+) -> np.ndarray:
+    """
+    (resample x session) matrix of reordered (SHUFFLE) or redrawn (BOOTSTRAP) session returns.
+    """
+    n_sessions = len(percent_returns)
+    if method == ResampleMethod.SHUFFLE:
+        order = np.argsort(rng.random((n_resamples, n_sessions)), axis=1)
+    else:
+        assert method == ResampleMethod.BOOTSTRAP
+        order = rng.integers(0, n_sessions, size=(n_resamples, n_sessions))
+    return percent_returns[order]
+
+
+def block_bootstrap_prices(
+    open_prices: np.ndarray,
+    close_prices: np.ndarray,
+    n_resamples: int,
+    block_size: int,
+    rng: np.random.Generator,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (time x path) open and close prices rebuilt from circular moving blocks of bar returns.
+
+    Every bar is described by its close to close return and its overnight gap to the open,
+    blocks of consecutive bars keep short term autocorrelation intact.
+    """
+    close_ratio = close_prices[1:] / close_prices[:-1]
+    open_gap = open_prices[1:] / close_prices[:-1]
+    n_bars = len(close_ratio)
+
+    n_blocks = -(-n_bars // block_size)
+    block_starts = rng.integers(0, n_bars, size=(n_blocks, 1, n_resamples))
+    bar_index = (block_starts + np.arange(block_size)[None, :, None]) % n_bars
+    bar_index = bar_index.reshape(n_blocks * block_size, n_resamples)[:n_bars]
+
+    close_paths = np.empty((n_bars + 1, n_resamples))
+    close_paths[0] = close_prices[0]
+    close_paths[1:] = close_prices[0] * np.cumprod(close_ratio[bar_index], axis=0)
+
+    open_paths = np.empty((n_bars + 1, n_resamples))
+    open_paths[0] = open_prices[0]
+    open_paths[1:] = close_paths[:-1] * open_gap[bar_index]
+
+    return open_paths, close_paths
+
+
+def evaluate_paths(
+    open_paths: np.ndarray,
+    close_paths: np.ndarray,
+    signal_fn: Callable[[np.ndarray], np.ndarray],
+    capture_trend: Trend = Trend.ALL,
+) -> np.ndarray:
+    """
+    runs a crossover style strategy over every price path at once and returns the
+    NaN padded (path x session) matrix of session returns.
+    """
+    states = signal_fn(close_paths).astype(np.int8)
+    sessions = state_session_returns(states, open_paths, close_paths)
+
+    keep = np.ones(len(sessions.state), dtype=bool)
+    if capture_trend == Trend.BULLISH:
+        keep &= sessions.state == 1
+    elif capture_trend == Trend.BEARISH:
+        keep &= sessions.state == 0
+
+    return padded_session_returns(
+        sessions.combination[keep],
+        sessions.percent_returns[keep],
+        n_paths=states.shape[1],
+    )
+
+
+def shuffle_batch(
+    n_resamples: int,
+    rng: np.random.Generator,
+    percent_returns: np.ndarray,
+    method: ResampleMethod,
+) -> pd.DataFrame:
+    return summarize_session_returns(
+        resample_returns(percent_returns, n_resamples, rng=rng, method=method)
+    )
+
+
+def bootstrap_batch(
+    n_resamples: int,
+    rng: np.random.Generator,
+    open_prices: np.ndarray,
+    close_prices: np.ndarray,
+    signal_fn: Callable[[np.ndarray], np.ndarray],
+    block_size: int,
+    capture_trend: Trend,
+) -> pd.DataFrame:
+    open_paths, close_paths = block_bootstrap_prices(
+        open_prices, close_prices, n_resamples, block_size=block_size, rng=rng
+    )
+    return summarize_session_returns(
+        evaluate_paths(open_paths, close_paths, signal_fn, capture_trend)
+    )
+
+
+def run_batch(task) -> pd.DataFrame:
+    batch_fn, n_resamples, seed_sequence, kwargs = task
+    return batch_fn(
+        n_resamples=n_resamples, rng=np.random.default_rng(seed_sequence), **kwargs
+    )
+
+
+@dataclass
+class RobustnessEngine:
+    """
+    Monte Carlo robustness checks for strategy returns.
+
+    Resamples are generated in batches of `batch_size`, each batch seeded from its own
+    child of `seed` so that results do not depend on `n_jobs`.
+    """
+
+    n_resamples: int = 10000
+    seed: Optional[int] = None
+    batch_size: int = 2000
+    n_jobs: int = 1
+
+    def run(self, batch_fn: Callable, **kwargs) -> pd.DataFrame:
+
+        batch_sizes: List[int] = [self.batch_size] * (
+            self.n_resamples // self.batch_size
+        )
+        if self.n_resamples % self.batch_size:
+            batch_sizes.append(self.n_resamples % self.batch_size)
+
+        seed_sequences = np.random.SeedSequence(self.seed).spawn(len(batch_sizes))
+        tasks = [
+            (batch_fn, n_resamples, seed_sequence, kwargs)
+            for n_resamples, seed_sequence in zip(batch_sizes, seed_sequences)
+        ]
+
+        if self.n_jobs > 1:
+            with ProcessPoolExecutor(max_workers=self.n_jobs) as executor:
+                results = list(executor.map(run_batch, tasks))
+        else:
+            results = list(map(run_batch, tasks))
+
+        return pd.concat(results, ignore_index=True)
+
+    def resample_sessions(
+        self,
+        session_returns: pd.DataFrame,
+        method: ResampleMethod = ResampleMethod.SHUFFLE,
+    ) -> pd.DataFrame:
+        """
+        resamples the per session returns of `evaluate_ma_crossover` / `evaluate_macd_crossover`.
+
+        SHUFFLE reorders sessions which only changes the drawdown, BOOTSTRAP draws sessions
+        with replacement.
+        """
+        assert (
+            "percent_returns" in session_returns.columns
+        ), f"Expecting percent_returns column. Received {session_returns.columns}"
+
+        return self.run(
+            shuffle_batch,
+            percent_returns=session_returns["percent_returns"].values.astype(float),
+            method=method,
+        )
+
+    def bootstrap_prices(
+        self,
+        ticker_df: Union[pd.DataFrame, CompactOHLCV],
+        signal_fn: Callable[[np.ndarray], np.ndarray],
+        block_size: int = 20,
+        capture_trend: Trend = Trend.ALL,
+    ) -> pd.DataFrame:
+        """
+        block bootstraps the price series and reruns the strategy on every resampled path.
+
+        `signal_fn` maps a (time x path) close price matrix to a boolean bullish signal,
+        e.g. `MACrossoverSignal` or `MACDCrossoverSignal`.
+        """
+        ticker_df = TickerData(ticker_df=ticker_df).ticker_df
+        assert block_size > 0, f"block_size should be positive, received - {block_size}"
+
+        return self.run(
+            bootstrap_batch,
+            open_prices=ticker_df["open"].values.astype(float),
+            close_prices=ticker_df["close"].values.astype(float),
+            signal_fn=signal_fn,
+            block_size=block_size,
+            capture_trend=capture_trend,
+        )
+
+    @staticmethod
+    def confidence_intervals(
+        resampled_metrics: pd.DataFrame, quantiles: List[float] = [0.05, 0.5, 0.95]
+    ) -> pd.DataFrame:
+        return resampled_metrics.quantile(quantiles)
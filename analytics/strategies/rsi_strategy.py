@@ -0,0 +1,273 @@
+from dataclasses import dataclass
+from typing import List, Optional, Tuple, Union
+
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+
+from analytics.strategies.utils import (
+    Trend,
+    label_sessions,
+    session_ids,
+    session_returns_frame,
+    state_session_returns,
+)
+from analytics.studies.data_definition import CompactOHLCV
+from analytics.studies.moving_averages import MAModels, MovingAverages
+from analytics.studies.rsi import RSI, RSIMethod
+
+
+@dataclass
+class RSIStrategy(RSI, MovingAverages):
+
+    span: int = 14
+    oversold: float = 30
+    overbought: float = 70
+    method: RSIMethod = RSIMethod.WILDER
+    trend_ma: Optional[int] = None
+    ma_model: MAModels = MAModels.SMA
+
+    def __post_init__(self):
+        super().__post_init__()
+
+        assert (
+            self.oversold < self.overbought
+        ), f"oversold threshold should be lower than overbought - received - oversold - {self.oversold}, overbought - {self.overbought}"
+        self.column_suffix = f"{self.span}_{self.oversold}_{self.overbought}"
+
+    def trend_filter(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        returns masks of rows where bullish and bearish entries are allowed.
+
+        Bullish entries need the close above the trend MA, bearish ones below it.
+        """
+        n_rows = len(self.ticker_df)
+        if self.trend_ma is None:
+            return np.ones(n_rows, dtype=bool), np.ones(n_rows, dtype=bool)
+
+        if self.ma_model == MAModels.SMA:
+            trend_ma = self.compute_sma(look_back_periods=[self.trend_ma])
+            trend_ma = trend_ma[f"ma_{self.trend_ma}"].values
+        else:
+            assert self.ma_model == MAModels.EWMA
+            trend_ma = self.compute_ema(look_back_periods=[self.trend_ma])
+            trend_ma = trend_ma[f"ema_{self.trend_ma}"].values
+
+        close = self.ticker_df["close"].values
+        return close > trend_ma, close < trend_ma
+
+    def rsi_sessions(self):
+
+        rsi_df = self.ticker_df.copy()
+        rsi_df[f"rsi_{self.span}"] = RSI.rsi_from_delta(
+            rsi_df["close"].diff(), span=self.span, method=self.method
+        )
+
+        allow_bullish, allow_bearish = self.trend_filter()
+
+        # A bullish session is entered once RSI drops below the oversold threshold and lasts until RSI
+        # rises above the overbought threshold, which in turn enters a bearish session.
+        entries = pd.Series(np.nan, index=rsi_df.index)
+        entries[(rsi_df[f"rsi_{self.span}"] < self.oversold).values & allow_bullish] = 1
+        entries[
+            (rsi_df[f"rsi_{self.span}"] > self.overbought).values & allow_bearish
+        ] = 0
+        entries = entries.ffill()
+
+        # rows before the first entry do not belong to any session
+        in_session = entries.notna()
+        rsi_df[f"rsi_signal_{self.column_suffix}"] = entries.fillna(0).astype(bool)
+
+        rsi_df[f"rsi_session_{self.column_suffix}"] = session_ids(
+            rsi_df[f"rsi_signal_{self.column_suffix}"], compact=self.compact
+        )
+
+        # annotate session as either bullish or bearish
+        rsi_df[f"label_{self.column_suffix}"] = pd.Series(
+            label_sessions(
+                rsi_df[f"rsi_signal_{self.column_suffix}"], compact=self.compact
+            ),
+            index=rsi_df.index,
+        ).where(in_session)
+
+        return rsi_df
+
+    @classmethod
+    def evaluate_rsi(
+        cls,
+        ticker_df: Union[pd.DataFrame, CompactOHLCV],
+        span: int = 14,
+        oversold: float = 30,
+        overbought: float = 70,
+        method: RSIMethod = RSIMethod.WILDER,
+        trend_ma: Optional[int] = None,
+        capture_trend: Trend = Trend.ALL,
+        ma_model: MAModels = MAModels.SMA,
+    ):
+        """
+        1. computes RSI and the optional trend MA
+        2. Annotates sessions entered at oversold / overbought thresholds
+        3. Aggregates data by session and trend to compute estimated resturns per session.
+        """
+
+        rsi_obj = cls(
+            ticker_df=ticker_df,
+            span=span,
+            oversold=oversold,
+            overbought=overbought,
+            method=method,
+            trend_ma=trend_ma,
+            ma_model=ma_model,
+        )
+
+        ticker_rsi_sessions = rsi_obj.rsi_sessions()
+
+        column_suffix = rsi_obj.column_suffix
+        # rows before the first entry have no label and do not belong to any session
+        states = np.where(
+            ticker_rsi_sessions[f"label_{column_suffix}"].notna(),
+            ticker_rsi_sessions[f"rsi_signal_{column_suffix}"].values,
+            -1,
+        )
+
+        # aggregate session to compute estimated returns per session.
+        sessions = state_session_returns(
+            states.reshape(-1, 1),
+            open_prices=ticker_rsi_sessions["open"].values.astype(float),
+            close_prices=ticker_rsi_sessions["close"].values.astype(float),
+        )
+        aggregated_returns = session_returns_frame(
+            sessions,
+            index=ticker_rsi_sessions.index,
+            names=[f"rsi_session_{column_suffix}", f"label_{column_suffix}"],
+            session_numbers=ticker_rsi_sessions[f"rsi_session_{column_suffix}"].values[
+                sessions.start_row
+            ],
+        )
+
+        # Filter results for ease of decision making.
+        if capture_trend in [Trend.BULLISH, Trend.BEARISH]:
+            aggregated_returns = aggregated_returns.loc[
+                aggregated_returns.index.get_level_values(f"label_{column_suffix}")
+                == capture_trend.value
+            ]
+
+        return aggregated_returns
+
+    @classmethod
+    def sweep_rsi_thresholds(
+        cls,
+        ticker_df: Union[pd.DataFrame, CompactOHLCV],
+        spans: List[int],
+        thresholds: List[Tuple[float, float]],
+        method: RSIMethod = RSIMethod.WILDER,
+        trend_ma: Optional[int] = None,
+        capture_trend: Trend = Trend.ALL,
+        ma_model: MAModels = MAModels.SMA,
+    ) -> pd.DataFrame:
+        """
+        Evaluates every (span, oversold, overbought) combination in one vectorized pass.
+
+        The close price delta and trend filter are computed once, RSI once per span and the
+        threshold grid is broadcast against it. Returns summary statistics per combination
+        which agree with aggregating `evaluate_rsi` for the same parameters.
+        """
+
+        # the first combination validates the thresholds and prepares the shared inputs
+        rsi_obj = cls(
+            ticker_df=ticker_df,
+            span=spans[0],
+            oversold=thresholds[0][0],
+            overbought=thresholds[0][1],
+            method=method,
+            trend_ma=trend_ma,
+            ma_model=ma_model,
+        )
+        for oversold, overbought in thresholds:
+            assert (
+                oversold < overbought
+            ), f"oversold threshold should be lower than overbought - received - oversold - {oversold}, overbought - {overbought}"
+
+        delta_close = rsi_obj.ticker_df["close"].astype(float).diff()
+        allow_bullish, allow_bearish = rsi_obj.trend_filter()
+
+        # (time x span) RSI matrix, NaN during the first `span` rows
+        rsi_matrix = np.column_stack(
+            [
+                RSI.rsi_from_delta(delta_close, span=span, method=method).values
+                for span in spans
+            ]
+        )
+        oversold = np.array([threshold[0] for threshold in thresholds], dtype=float)
+        overbought = np.array([threshold[1] for threshold in thresholds], dtype=float)
+
+        # (time x span x threshold) entries: 1 bullish, 0 bearish, -1 no entry
+        bullish_entries = (rsi_matrix[:, :, None] < oversold) & allow_bullish[
+            :, None, None
+        ]
+        bearish_entries = (rsi_matrix[:, :, None] > overbought) & allow_bearish[
+            :, None, None
+        ]
+        entries = np.where(bullish_entries, 1, np.where(bearish_entries, 0, -1))
+        n_rows = entries.shape[0]
+        entries = entries.reshape(n_rows, -1)
+
+        # forward fill the last entry along the time axis
+        last_entry_idx = np.where(entries >= 0, np.arange(n_rows)[:, None], 0)
+        last_entry_idx = np.maximum.accumulate(last_entry_idx, axis=0)
+        states = np.take_along_axis(entries, last_entry_idx, axis=0)
+
+        session_returns = cls._state_session_returns(
+            states=states,
+            open_prices=rsi_obj.ticker_df["open"].values.astype(float),
+            close_prices=rsi_obj.ticker_df["close"].values.astype(float),
+            capture_trend=capture_trend,
+        )
+
+        index = pd.MultiIndex.from_tuples(
+            [
+                (span, threshold[0], threshold[1])
+                for span in spans
+                for threshold in thresholds
+            ],
+            names=["span", "oversold", "overbought"],
+        )
+        return pd.DataFrame(session_returns, index=index)
+
+    @staticmethod
+    def _state_session_returns(
+        states: np.ndarray,
+        open_prices: np.ndarray,
+        close_prices: np.ndarray,
+        capture_trend: Trend = Trend.ALL,
+    ):
+        """
+        aggregate session returns for a (time x combination) matrix of session states.
+        """
+        n_combinations = states.shape[1]
+
+        sessions = state_session_returns(states, open_prices, close_prices)
+
+        keep = np.ones(len(sessions.state), dtype=bool)
+        if capture_trend == Trend.BULLISH:
+            keep &= sessions.state == 1
+        elif capture_trend == Trend.BEARISH:
+            keep &= sessions.state == 0
+
+        combination = sessions.combination[keep]
+        perc_returns = sessions.percent_returns[keep]
+
+        n_sessions = np.bincount(combination, minlength=n_combinations)
+        total_returns = np.bincount(
+            combination, weights=perc_returns, minlength=n_combinations
+        )
+        n_wins = np.bincount(
+            combination, weights=perc_returns > 0, minlength=n_combinations
+        )
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return {
+                "number_of_sessions": n_sessions,
+                "total_percent_returns": total_returns,
+                "mean_percent_returns": total_returns / n_sessions,
+                "win_rate": n_wins / n_sessions,
+            }
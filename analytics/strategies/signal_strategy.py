@@ -0,0 +1,114 @@
+from dataclasses import dataclass
+from typing import Dict, Union
+
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+
+from analytics.strategies.signals import Signal, SignalPlan, compile_signals
+from analytics.strategies.utils import (
+    Trend,
+    label_sessions,
+    session_ids,
+    session_returns_frame,
+    state_session_returns,
+)
+from analytics.studies.data_definition import CompactOHLCV, TickerData
+
+
+@dataclass
+class SignalStrategy(TickerData):
+
+    signal: Signal
+    name: str = "signal"
+
+    def __post_init__(self):
+        super().__post_init__()
+        self.plan: SignalPlan = compile_signals({self.name: self.signal})
+
+    def signal_sessions(self):
+
+        signal_df = self.ticker_df.copy()
+        signal_df[f"signal_{self.name}"] = self.plan.evaluate_arrays(self.ticker_df)[
+            self.name
+        ]
+
+        # A session lasts as long as the composed signal does not flip.
+        signal_df[f"signal_session_{self.name}"] = session_ids(
+            signal_df[f"signal_{self.name}"], compact=self.compact
+        )
+
+        # annotate session as either bullish or bearish
+        signal_df[f"label_{self.name}"] = label_sessions(
+            signal_df[f"signal_{self.name}"], compact=self.compact
+        )
+        return signal_df
+
+    @staticmethod
+    def session_returns(
+        signal: np.ndarray,
+        open_prices: np.ndarray,
+        close_prices: np.ndarray,
+        index: pd.Index,
+        name: str = "signal",
+    ) -> pd.DataFrame:
+        """
+        vectorized equivalent of grouping sessions and applying `compute_returns`.
+        """
+        sessions = state_session_returns(
+            np.asarray(signal, dtype=np.int8).reshape(-1, 1), open_prices, close_prices
+        )
+        return session_returns_frame(
+            sessions, index=index, names=[f"signal_session_{name}", f"label_{name}"]
+        )
+
+    @classmethod
+    def evaluate_signals(
+        cls,
+        ticker_df: Union[pd.DataFrame, CompactOHLCV],
+        signals: Dict[str, Signal],
+        capture_trend: Trend = Trend.ALL,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        1. Compiles all signals into a single plan, sharing indicators between them
+        2. Evaluates the plan in one pass over the price arrays
+        3. Aggregates returns per session for every signal.
+        """
+
+        ticker_data = TickerData(ticker_df=ticker_df)
+        plan = compile_signals(signals)
+        evaluated_signals = plan.evaluate_arrays(ticker_data.ticker_df)
+
+        open_prices = ticker_data.ticker_df["open"].values.astype(float)
+        close_prices = ticker_data.ticker_df["close"].values.astype(float)
+
+        results = {}
+        for name, signal in evaluated_signals.items():
+            aggregated_returns = cls.session_returns(
+                signal=signal,
+                open_prices=open_prices,
+                close_prices=close_prices,
+                index=ticker_data.ticker_df.index,
+                name=name,
+            )
+
+            # Filter results for ease of decision making.
+            if capture_trend in [Trend.BULLISH, Trend.BEARISH]:
+                aggregated_returns = aggregated_returns.loc[
+                    aggregated_returns.index.get_level_values(f"label_{name}")
+                    == capture_trend.value
+                ]
+            results[name] = aggregated_returns
+
+        return results
+
+    @classmethod
+    def evaluate_signal(
+        cls,
+        ticker_df: Union[pd.DataFrame, CompactOHLCV],
+        signal: Signal,
+        capture_trend: Trend = Trend.ALL,
+    ) -> pd.DataFrame:
+
+        return cls.evaluate_signals(
+            ticker_df=ticker_df, signals={"signal": signal}, capture_trend=capture_trend
+        )["signal"]
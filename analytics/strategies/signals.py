@@ -0,0 +1,359 @@
+"""
+Small expression layer for composing trading signals out of the existing studies.
+
+    >>> entry = crosses_above(MACDValue(26, 12, 9), MACDValue(26, 12, 9, "macd_signal"))
+    >>> signal = entry & (RSIValue(14) < 70) & (Price() > SMA(200))
+
+Signals are compiled into a `SignalPlan` which computes every distinct indicator once and
+evaluates all signals over NumPy arrays.
+"""
+
+import dataclasses
+import operator
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Dict, Iterator, List, Tuple, Union
+
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+
+from analytics.studies.macd import MACD
+from analytics.studies.moving_averages import MovingAverages
+from analytics.studies.rsi import RSI, RSIMethod
+
+
+class CompareOperator(Enum):
+    GT: str = ">"
+    GE: str = ">="
+    LT: str = "<"
+    LE: str = "<="
+
+
+COMPARE_FUNCTIONS: Dict[CompareOperator, Callable] = {
+    CompareOperator.GT: operator.gt,
+    CompareOperator.GE: operator.ge,
+    CompareOperator.LT: operator.lt,
+    CompareOperator.LE: operator.le,
+}
+
+
+class CrossDirection(Enum):
+    ABOVE: str = "above"
+    BELOW: str = "below"
+
+
+class Expression:
+    """
+    numeric series such as prices or indicators. Comparisons produce signals.
+    """
+
+    def _compare(self, other, op: CompareOperator) -> "Compare":
+        return Compare(op=op, left=self, right=as_expression(other))
+
+    def __gt__(self, other):
+        return self._compare(other, CompareOperator.GT)
+
+    def __ge__(self, other):
+        return self._compare(other, CompareOperator.GE)
+
+    def __lt__(self, other):
+        return self._compare(other, CompareOperator.LT)
+
+    def __le__(self, other):
+        return self._compare(other, CompareOperator.LE)
+
+
+class Signal:
+    """
+    boolean series, True marks bullish rows and False bearish ones.
+    """
+
+    def __and__(self, other: "Signal") -> "Signal":
+        return AllOf(operands=(self, other))
+
+    def __or__(self, other: "Signal") -> "Signal":
+        return AnyOf(operands=(self, other))
+
+    def __invert__(self) -> "Signal":
+        return Not(operand=self)
+
+
+@dataclass(frozen=True)
+class Constant(Expression):
+    value: float
+
+
+@dataclass(frozen=True)
+class Price(Expression):
+    column: str = "close"
+
+
+@dataclass(frozen=True)
+class SMA(Expression):
+    period: int
+    column: str = "close"
+
+
+@dataclass(frozen=True)
+class EMA(Expression):
+    period: int
+    column: str = "close"
+
+
+@dataclass(frozen=True)
+class RSIValue(Expression):
+    span: int = 14
+    method: RSIMethod = RSIMethod.WILDER
+
+
+@dataclass(frozen=True)
+class MACDValue(Expression):
+    slow_ma: int = 26
+    fast_ma: int = 12
+    signal_line_period: int = 9
+    line: str = "macd_line"
+
+    def __post_init__(self):
+        assert self.line in [
+            "macd_line",
+            "macd_signal",
+            "macd_histogram",
+        ], f"unknown MACD line - {self.line}"
+
+
+@dataclass(frozen=True)
+class Compare(Signal):
+    op: CompareOperator
+    left: Expression
+    right: Expression
+
+
+@dataclass(frozen=True)
+class Cross(Signal):
+    left: Expression
+    right: Expression
+    direction: CrossDirection = CrossDirection.ABOVE
+
+
+@dataclass(frozen=True)
+class AllOf(Signal):
+    operands: Tuple[Signal, ...]
+
+
+@dataclass(frozen=True)
+class AnyOf(Signal):
+    operands: Tuple[Signal, ...]
+
+
+@dataclass(frozen=True)
+class Not(Signal):
+    operand: Signal
+
+
+@dataclass(frozen=True)
+class Hold(Signal):
+    """
+    True from the bar `entry` fires until the bar `exit` fires. Exits win on ties.
+    """
+
+    entry: Signal
+    exit: Signal
+
+
+@dataclass(frozen=True)
+class HoldFor(Signal):
+    """
+    True for `bars` bars starting at the latest bar `entry` fired on.
+    """
+
+    entry: Signal
+    bars: int
+
+
+Node = Union[Expression, Signal]
+Indicator = Union[Price, SMA, EMA, RSIValue, MACDValue]
+INDICATOR_TYPES = (Price, SMA, EMA, RSIValue, MACDValue)
+
+
+def as_expression(value: Union[Expression, float]) -> Expression:
+    if isinstance(value, Expression):
+        return value
+    return Constant(value=float(value))
+
+
+def crosses_above(left, right) -> Cross:
+    return Cross(
+        left=as_expression(left),
+        right=as_expression(right),
+        direction=CrossDirection.ABOVE,
+    )
+
+
+def crosses_below(left, right) -> Cross:
+    return Cross(
+        left=as_expression(left),
+        right=as_expression(right),
+        direction=CrossDirection.BELOW,
+    )
+
+
+def hold(entry: Signal, exit: Signal) -> Hold:
+    return Hold(entry=entry, exit=exit)
+
+
+def hold_for(entry: Signal, bars: int) -> HoldFor:
+    assert bars > 0, f"bars should be positive, received - {bars}"
+    return HoldFor(entry=entry, bars=bars)
+
+
+def child_nodes(node: Node) -> Iterator[Node]:
+    for field in dataclasses.fields(node):
+        value = getattr(node, field.name)
+        if isinstance(value, (Expression, Signal)):
+            yield value
+        elif isinstance(value, tuple):
+            yield from (
+                item for item in value if isinstance(item, (Expression, Signal))
+            )
+
+
+def last_index(mask: np.ndarray) -> np.ndarray:
+    """
+    index of the latest True value at or before every row, -1 when there is none.
+    """
+    positions = np.where(mask, np.arange(len(mask)), -1)
+    return np.maximum.accumulate(positions)
+
+
+@dataclass
+class SignalPlan:
+    """
+    compiled evaluation plan for a set of named signals.
+
+    Identical sub expressions are evaluated once and indicators are grouped so that every
+    study is computed a single time for all the signals sharing it.
+    """
+
+    signals: Dict[str, Signal]
+
+    def __post_init__(self):
+
+        self.indicators: List[Indicator] = []
+        seen = set()
+        stack: List[Node] = list(self.signals.values())
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            if isinstance(node, INDICATOR_TYPES):
+                self.indicators.append(node)
+            stack.extend(child_nodes(node))
+
+    def compute_indicators(self, ticker_df: pd.DataFrame) -> Dict[Node, np.ndarray]:
+
+        values: Dict[Node, np.ndarray] = {}
+
+        sma_periods: Dict[str, List[int]] = {}
+        ema_periods: Dict[str, List[int]] = {}
+        rsi_nodes: List[RSIValue] = []
+        macd_params = set()
+
+        for node in self.indicators:
+            if isinstance(node, Price):
+                values[node] = ticker_df[node.column].values.astype(float)
+            elif isinstance(node, SMA):
+                sma_periods.setdefault(node.column, []).append(node.period)
+            elif isinstance(node, EMA):
+                ema_periods.setdefault(node.column, []).append(node.period)
+            elif isinstance(node, RSIValue):
+                rsi_nodes.append(node)
+            else:
+                macd_params.add((node.slow_ma, node.fast_ma, node.signal_line_period))
+
+        ma_study = MovingAverages(ticker_df=ticker_df)
+        for column, periods in sma_periods.items():
+            sma_df = ma_study.compute_sma(column=column, look_back_periods=periods)
+            for period in periods:
+                values[SMA(period, column)] = sma_df[f"ma_{period}"].values
+
+        for column, periods in ema_periods.items():
+            ema_df = ma_study.compute_ema(column=column, look_back_periods=periods)
+            for period in periods:
+                values[EMA(period, column)] = ema_df[f"ema_{period}"].values
+
+        if rsi_nodes:
+            delta_close = ticker_df["close"].diff()
+            for node in rsi_nodes:
+                values[node] = RSI.rsi_from_delta(
+                    delta_close, span=node.span, method=node.method
+                ).values
+
+        for slow_ma, fast_ma, signal_line_period in macd_params:
+            macd_df = MACD(
+                ticker_df=ticker_df,
+                slow_ma=slow_ma,
+                fast_ma=fast_ma,
+                signal_line_period=signal_line_period,
+            ).compute_macd()
+            for line in ["macd_line", "macd_signal", "macd_histogram"]:
+                values[MACDValue(slow_ma, fast_ma, signal_line_period, line)] = macd_df[
+                    line
+                ].values
+
+        return values
+
+    def evaluate_arrays(self, ticker_df: pd.DataFrame) -> Dict[str, np.ndarray]:
+
+        n_rows = len(ticker_df)
+        values = self.compute_indicators(ticker_df)
+
+        def evaluate(node: Node) -> np.ndarray:
+            if node in values:
+                return values[node]
+
+            if isinstance(node, Constant):
+                result = np.full(n_rows, node.value)
+            elif isinstance(node, Compare):
+                result = COMPARE_FUNCTIONS[node.op](
+                    evaluate(node.left), evaluate(node.right)
+                )
+            elif isinstance(node, Cross):
+                left, right = evaluate(node.left), evaluate(node.right)
+                if node.direction == CrossDirection.ABOVE:
+                    current, previous = left > right, left <= right
+                else:
+                    current, previous = left < right, left >= right
+                result = current & np.concatenate([[False], previous[:-1]])
+            elif isinstance(node, AllOf):
+                result = np.logical_and.reduce([evaluate(op) for op in node.operands])
+            elif isinstance(node, AnyOf):
+                result = np.logical_or.reduce([evaluate(op) for op in node.operands])
+            elif isinstance(node, Not):
+                result = ~evaluate(node.operand)
+            elif isinstance(node, Hold):
+                entry, exit = evaluate(node.entry), evaluate(node.exit)
+                last_entry, last_exit = last_index(entry), last_index(exit)
+                result = last_entry > last_exit
+            elif isinstance(node, HoldFor):
+                last_entry = last_index(evaluate(node.entry))
+                result = (last_entry >= 0) & (
+                    np.arange(n_rows) - last_entry < node.bars
+                )
+            else:
+                raise ValueError(f"Node {node} not supported")
+
+            values[node] = result
+            return result
+
+        return {name: evaluate(signal) for name, signal in self.signals.items()}
+
+    def evaluate(self, ticker_df: pd.DataFrame) -> pd.DataFrame:
+        return pd.DataFrame(self.evaluate_arrays(ticker_df), index=ticker_df.index)
+
+
+def compile_signals(signals: Union[Signal, Dict[str, Signal]]) -> SignalPlan:
+
+    if isinstance(signals, Signal):
+        signals = {"signal": signals}
+    return SignalPlan(signals=signals)
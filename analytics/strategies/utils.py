@@ -1,4 +1,8 @@
 from enum import Enum
+from typing import List, NamedTuple, Optional
+
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
 
 
 class Trend(Enum):
@@ -6,3 +10,147 @@ class Trend(Enum):
     BEARISH: str = "bearish"
     BULLISH: str = "bullish"
     ALL: str = "all"
+
+
+def label_sessions(signal: pd.Series, compact: bool = False):
+    """
+    annotate every row as either bullish or bearish based on a boolean crossover signal.
+
+    compact mode returns an int8 backed categorical instead of python strings.
+    """
+    if compact:
+        return pd.Categorical.from_codes(
+            signal.values.astype(np.int8),
+            categories=[Trend.BEARISH.value, Trend.BULLISH.value],
+        )
+    return np.where(signal == 1, Trend.BULLISH.value, Trend.BEARISH.value)
+
+
+def session_ids(signal: pd.Series, compact: bool = False) -> pd.Series:
+    """
+    A sessions last as long as the signal does not flip.
+    We use EX-OR truth table to identify change overs.
+    """
+    sessions = (signal ^ signal.shift(1)).fillna(False).cumsum(skipna=False)
+    if compact:
+        return sessions.astype(np.int32)
+    return sessions
+
+
+class StateSessions(NamedTuple):
+
+    combination: np.ndarray
+    state: np.ndarray
+    start_row: np.ndarray
+    end_row: np.ndarray
+    percent_returns: np.ndarray
+
+
+def session_percent_returns(
+    is_bullish: np.ndarray,
+    start_open: np.ndarray,
+    start_close: np.ndarray,
+    end_open: np.ndarray,
+    end_close: np.ndarray,
+) -> np.ndarray:
+    """
+    bullish sessions buy at the first open and sell at the last close, bearish sessions
+    sell at the first close and buy back at the last open.
+    """
+    buy_val = np.where(is_bullish, start_open, end_open)
+    sell_val = np.where(is_bullish, end_close, start_close)
+    return ((sell_val - buy_val) / buy_val) * 100
+
+
+def state_session_returns(
+    states: np.ndarray, open_prices: np.ndarray, close_prices: np.ndarray
+) -> StateSessions:
+    """
+    vectorized session returns for a (time x combination) matrix of session states.
+
+    States are 1 for bullish, 0 for bearish and -1 for rows outside of any session,
+    the latter are dropped. Prices are either shared (time,) or per combination
+    (time x combination). Sessions come out ordered by combination and then by time.
+    """
+    n_rows, n_combinations = states.shape
+    if n_rows == 0:
+        empty = np.array([], dtype=int)
+        return StateSessions(
+            combination=empty,
+            state=empty,
+            start_row=empty,
+            end_row=empty,
+            percent_returns=np.array([], dtype=float),
+        )
+
+    # lay combinations out back to back so that sessions never span two combinations
+    flat_states = states.T.ravel()
+    positions = np.arange(flat_states.size)
+    is_first_row = positions % n_rows == 0
+    is_last_row = positions % n_rows == n_rows - 1
+
+    starts = np.flatnonzero(is_first_row | (flat_states != np.roll(flat_states, 1)))
+    ends = np.flatnonzero(is_last_row | (flat_states != np.roll(flat_states, -1)))
+
+    session_state = flat_states[starts]
+    in_session = session_state >= 0
+    starts, ends, session_state = (
+        starts[in_session],
+        ends[in_session],
+        session_state[in_session],
+    )
+    combination = starts // n_rows
+    start_row, end_row = starts % n_rows, ends % n_rows
+
+    open_prices = np.broadcast_to(open_prices.reshape(n_rows, -1), states.shape)
+    close_prices = np.broadcast_to(close_prices.reshape(n_rows, -1), states.shape)
+
+    perc_returns = session_percent_returns(
+        is_bullish=session_state == 1,
+        start_open=open_prices[start_row, combination],
+        start_close=close_prices[start_row, combination],
+        end_open=open_prices[end_row, combination],
+        end_close=close_prices[end_row, combination],
+    )
+
+    return StateSessions(
+        combination=combination,
+        state=session_state,
+        start_row=start_row,
+        end_row=end_row,
+        percent_returns=perc_returns,
+    )
+
+
+def session_returns_frame(
+    sessions: StateSessions,
+    index: pd.Index,
+    names: List[str],
+    session_numbers: Optional[np.ndarray] = None,
+) -> pd.DataFrame:
+    """
+    returns per session of a single combination, shaped like grouping sessions by
+    (session, label) and applying `compute_returns`. Sessions are numbered in order
+    unless `session_numbers` are given.
+    """
+    if session_numbers is None:
+        session_numbers = np.arange(len(sessions.state))
+
+    session_details = [
+        f"{start_ts}-{end_ts}"
+        for start_ts, end_ts in zip(index[sessions.start_row], index[sessions.end_row])
+    ]
+
+    return pd.DataFrame(
+        {
+            "percent_returns": sessions.percent_returns,
+            "session_details": session_details,
+        },
+        index=pd.MultiIndex.from_arrays(
+            [
+                session_numbers,
+                np.where(sessions.state == 1, Trend.BULLISH.value, Trend.BEARISH.value),
+            ],
+            names=names,
+        ),
+    )
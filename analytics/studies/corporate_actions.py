@@ -0,0 +1,288 @@
+"""
+Back adjustment of OHLCV panels for splits and dividends.
+
+A panel is a frame indexed by (symbol, date) with open, high, low, close and volume
+columns. Events are a table of symbol, ex-date, split ratio and cash dividend.
+
+Every event is turned into a price and volume factor once, all bars before its ex-date
+are multiplied by it. `AdjustmentFactorCache` keeps those factors so that new bars or new
+events only cost a lookup for the factors that are already known.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict
+
+import pandas as pd
+
+from analytics.studies.data_definition import OHLC_COLUMNS
+
+PANEL_INDEX_NAMES = ["symbol", "date"]
+EVENT_COLUMNS = ["symbol", "date", "split_ratio", "dividend"]
+
+
+def to_panel(ticker_frames: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    stack per symbol OHLCV frames into a (symbol, date) panel.
+    """
+    panel = pd.concat(ticker_frames, names=PANEL_INDEX_NAMES)
+    return panel.sort_index()
+
+
+def normalize_events(events_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    validate an events table, a missing split ratio means 1 and a missing dividend 0.
+    """
+    assert {"symbol", "date"}.issubset(
+        events_df.columns
+    ), f"Expecting symbol and date columns. Received {events_df.columns}"
+
+    events_df = events_df.copy()
+    events_df["date"] = pd.to_datetime(events_df["date"])
+    if "split_ratio" not in events_df.columns:
+        events_df["split_ratio"] = 1.0
+    if "dividend" not in events_df.columns:
+        events_df["dividend"] = 0.0
+    events_df["split_ratio"] = events_df["split_ratio"].fillna(1.0).astype(float)
+    events_df["dividend"] = events_df["dividend"].fillna(0.0).astype(float)
+
+    assert (
+        events_df["split_ratio"] > 0
+    ).all(), "split ratio should be positive for all events"
+
+    return (
+        events_df[EVENT_COLUMNS]
+        .sort_values(["symbol", "date"])
+        .drop_duplicates(subset=["symbol", "date"], keep="last")
+        .reset_index(drop=True)
+    )
+
+
+def events_from_daily_adjusted(daily_df: pd.DataFrame, symbol: str) -> pd.DataFrame:
+    """
+    extract split and dividend events from the `get_daily_data(adjusted=True)` frame.
+    """
+    expected_columns = {"dividend amount", "split coefficient"}
+    assert expected_columns.issubset(
+        daily_df.columns
+    ), f"Expecting columns {expected_columns}. Received {daily_df.columns}"
+
+    is_event = (daily_df["split coefficient"] != 1) | (daily_df["dividend amount"] != 0)
+    events_df = pd.DataFrame(
+        {
+            "symbol": symbol,
+            "date": daily_df.index[is_event],
+            "split_ratio": daily_df["split coefficient"].values[is_event],
+            "dividend": daily_df["dividend amount"].values[is_event],
+        }
+    )
+    return normalize_events(events_df)
+
+
+def lookup_bars(panel: pd.DataFrame) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "symbol": panel.index.get_level_values("symbol"),
+            "date": pd.to_datetime(panel.index.get_level_values("date")),
+            "close": panel["close"].values.astype(float),
+        }
+    )
+
+
+def with_previous_close(events_df: pd.DataFrame, bars_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    attach the last (unadjusted) close strictly before the ex-date of every event.
+    """
+    return pd.merge_asof(
+        events_df.sort_values("date"),
+        bars_df.sort_values("date").rename(columns={"close": "previous_close"}),
+        on="date",
+        by="symbol",
+        allow_exact_matches=False,
+        direction="backward",
+    )
+
+
+def event_factors(events_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    price and volume factor of every event, see `with_previous_close`.
+
+    The dividend factor is 1 - dividend / previous close, with the previous (unadjusted)
+    close restated in post split terms when a split shares the ex-date.
+    """
+    events_df = events_df.copy()
+
+    # dividends without an earlier bar have nothing to adjust
+    has_dividend = (events_df["dividend"] != 0) & events_df["previous_close"].notna()
+
+    dividend_factor = 1 - (
+        events_df["dividend"] * events_df["split_ratio"] / events_df["previous_close"]
+    ).where(has_dividend, 0.0)
+
+    events_df["price_factor"] = dividend_factor / events_df["split_ratio"]
+    events_df["volume_factor"] = events_df["split_ratio"]
+
+    return events_df.drop(columns="previous_close").sort_values(["symbol", "date"])
+
+
+def cumulative_factors(factors_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    product of the factors of an event and all later events of the same symbol.
+    """
+    reversed_df = factors_df.sort_values(["symbol", "date"]).iloc[::-1]
+    grouped = reversed_df.groupby("symbol", sort=False)
+    reversed_df = reversed_df.assign(
+        cumulative_price_factor=grouped["price_factor"].cumprod(),
+        cumulative_volume_factor=grouped["volume_factor"].cumprod(),
+    )
+    return reversed_df.iloc[::-1].reset_index(drop=True)
+
+
+def apply_factors(panel: pd.DataFrame, factors_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    back adjust a panel in one pass, every bar picks up the cumulative factor of the first
+    event strictly after it.
+    """
+    if not len(factors_df):
+        return panel.copy()
+
+    bars_df = lookup_bars(panel).reset_index().rename(columns={"index": "position"})
+
+    bar_factors = pd.merge_asof(
+        bars_df.sort_values("date"),
+        factors_df[
+            ["symbol", "date", "cumulative_price_factor", "cumulative_volume_factor"]
+        ]
+        .rename(columns={"date": "event_date"})
+        .sort_values("event_date"),
+        left_on="date",
+        right_on="event_date",
+        by="symbol",
+        allow_exact_matches=False,
+        direction="forward",
+    ).sort_values("position")
+
+    price_factor = bar_factors["cumulative_price_factor"].fillna(1.0).values
+    volume_factor = bar_factors["cumulative_volume_factor"].fillna(1.0).values
+
+    adjusted_panel = panel.copy()
+    for column in OHLC_COLUMNS:
+        adjusted_panel[column] = panel[column].values * price_factor
+    if "volume" in panel.columns:
+        adjusted_panel["volume"] = panel["volume"].values * volume_factor
+
+    return adjusted_panel
+
+
+def empty_factors() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "symbol": pd.Series(dtype=object),
+            "date": pd.Series(dtype="datetime64[ns]"),
+            "split_ratio": pd.Series(dtype=float),
+            "dividend": pd.Series(dtype=float),
+            "price_factor": pd.Series(dtype=float),
+            "volume_factor": pd.Series(dtype=float),
+        }
+    )
+
+
+def empty_bars() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "symbol": pd.Series(dtype=object),
+            "date": pd.Series(dtype="datetime64[ns]"),
+            "close": pd.Series(dtype=float),
+        }
+    )
+
+
+@dataclass
+class AdjustmentFactorCache:
+    """
+    caches event factors across calls.
+
+    Events are applied once their ex-date is covered by the bars seen so far, later calls
+    only compute factors for events that were not applied yet. Only the last close and
+    the first date of every symbol are kept, so that a panel of new bars alone is enough.
+
+    A dividend learned after its ex-date is priced against the panel passed in. When
+    neither the panel nor the last close has a bar right before the ex-date it is not
+    cached and stays pending until a panel covering its previous close is adjusted.
+    """
+
+    factors: pd.DataFrame = field(default_factory=empty_factors)
+    last_bars: pd.DataFrame = field(default_factory=empty_bars)
+    first_dates: pd.Series = field(
+        default_factory=lambda: pd.Series(dtype="datetime64[ns]")
+    )
+
+    def update(self, panel: pd.DataFrame, events_df: pd.DataFrame) -> pd.DataFrame:
+
+        events_df = normalize_events(events_df)
+        panel_bars = lookup_bars(panel)
+        bars_df = pd.concat([self.last_bars, panel_bars], ignore_index=True)
+
+        self.first_dates = (
+            pd.concat([self.first_dates, panel_bars.groupby("symbol")["date"].min()])
+            .groupby(level=0)
+            .min()
+        )
+
+        # events become effective once their ex-date has been seen
+        last_seen = bars_df.groupby("symbol")["date"].max()
+        is_effective = events_df["date"] <= events_df["symbol"].map(last_seen)
+
+        applied = pd.MultiIndex.from_frame(self.factors[["symbol", "date"]])
+        is_new = ~pd.MultiIndex.from_frame(events_df[["symbol", "date"]]).isin(applied)
+
+        new_events = with_previous_close(
+            events_df.loc[is_effective.values & is_new], bars_df
+        )
+
+        # a dividend after the first bar of its symbol needs the close before its ex-date
+        is_priced = (
+            (new_events["dividend"] == 0)
+            | new_events["previous_close"].notna()
+            | (new_events["date"] <= new_events["symbol"].map(self.first_dates))
+        )
+        new_events = new_events.loc[is_priced]
+        if len(new_events):
+            self.factors = pd.concat(
+                [self.factors, event_factors(new_events)], ignore_index=True
+            ).sort_values(["symbol", "date"])
+
+        self.last_bars = (
+            bars_df.sort_values("date").groupby("symbol", as_index=False).last()
+        )
+
+        return cumulative_factors(self.factors)
+
+
+@dataclass
+class CorporateActionAdjuster:
+
+    cache: AdjustmentFactorCache = field(default_factory=AdjustmentFactorCache)
+
+    def adjust_panel(
+        self, panel: pd.DataFrame, events_df: pd.DataFrame
+    ) -> pd.DataFrame:
+        """
+        back adjusts every symbol of a (symbol, date) panel for splits and dividends.
+        """
+        assert (
+            list(panel.index.names) == PANEL_INDEX_NAMES
+        ), f"Expecting panel indexed by {PANEL_INDEX_NAMES}. Received {panel.index.names}"
+
+        factors_df = self.cache.update(panel, events_df)
+        return apply_factors(panel, factors_df)
+
+    def adjust(
+        self, ticker_df: pd.DataFrame, events_df: pd.DataFrame, symbol: str
+    ) -> pd.DataFrame:
+        """
+        back adjusts a single ticker frame indexed by date.
+        """
+        panel = to_panel({symbol: ticker_df})
+        events_df = normalize_events(events_df)
+        events_df = events_df.loc[events_df["symbol"] == symbol]
+        return self.adjust_panel(panel, events_df).loc[symbol]
@@ -1,13 +1,94 @@
 from dataclasses import dataclass
+from typing import Union
 
+import numpy as np
 import pandas as pd
 
+OHLC_COLUMNS = ["open", "high", "low", "close"]
+
+
+class CompactOHLCV:
+    """
+    Array backed OHLCV container for large universes.
+
+    Prices are stored as float32, volume as int64 and timestamps as datetime64.
+    Frames without a datetime index keep their index labels as is.
+    """
+
+    __slots__ = ("index", "open", "high", "low", "close", "volume")
+
+    def __init__(
+        self,
+        index: np.ndarray,
+        open: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+    ):
+        self.index = np.asarray(index)
+        self.open = np.asarray(open, dtype=np.float32)
+        self.high = np.asarray(high, dtype=np.float32)
+        self.low = np.asarray(low, dtype=np.float32)
+        self.close = np.asarray(close, dtype=np.float32)
+        self.volume = np.asarray(volume, dtype=np.int64)
+
+        assert all(
+            len(getattr(self, attr)) == len(self.index) for attr in self.__slots__
+        ), "all OHLCV arrays must be of the same length as the index"
+
+    @classmethod
+    def from_frame(cls, ticker_df: pd.DataFrame) -> "CompactOHLCV":
+
+        expected_columns = set(OHLC_COLUMNS + ["volume"])
+        assert expected_columns.issubset(
+            ticker_df.columns
+        ), f"Expecting columns {expected_columns}. Received {ticker_df.columns}"
+
+        if isinstance(ticker_df.index, pd.DatetimeIndex):
+            index = ticker_df.index.values.astype("datetime64[ns]")
+        else:
+            index = ticker_df.index.values
+
+        return cls(
+            index=index,
+            volume=ticker_df["volume"].values,
+            **{column: ticker_df[column].values for column in OHLC_COLUMNS},
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "open": self.open,
+                "high": self.high,
+                "low": self.low,
+                "close": self.close,
+                "volume": self.volume,
+            },
+            index=self.index,
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, attr).nbytes for attr in self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
 
 # TODO: make TickerData richer
 @dataclass
 class TickerData:
 
-    ticker_df: pd.DataFrame
+    ticker_df: Union[pd.DataFrame, CompactOHLCV]
+
+    def __post_init__(self):
+
+        # studies and strategies operate on frames, compact inputs are unpacked here and
+        # the compact flag is carried along so that derived columns stay compact as well.
+        self.compact = isinstance(self.ticker_df, CompactOHLCV)
+        if self.compact:
+            self.ticker_df = self.ticker_df.to_frame()
 
     def get_ticker_data(self, offset=-1):
         return pd.DataFrame(self.ticker_df.iloc[offset]).T
@@ -1,8 +1,9 @@
 from dataclasses import dataclass
+from typing import Tuple
 
 import pandas as pd
 
-from analytics.studies.moving_averages import MovingAverages
+from analytics.studies.moving_averages import MovingAverages, PriceValues
 
 
 @dataclass
@@ -12,16 +13,40 @@ class MACD(MovingAverages):
     fast_ma: int
     signal_line_period: int
 
+    @staticmethod
+    def macd_from_emas(
+        fast_ema: PriceValues, slow_ema: PriceValues, signal_line_period: int
+    ) -> Tuple[PriceValues, PriceValues]:
+        macd_line = fast_ema - slow_ema
+        macd_signal = MovingAverages.ema(macd_line, signal_line_period)
+        return macd_line, macd_signal
+
+    @staticmethod
+    def macd_lines(
+        values: PriceValues, slow_ma: int, fast_ma: int, signal_line_period: int
+    ) -> Tuple[PriceValues, PriceValues]:
+        """
+        macd line and signal line of a price series, or of every column of a frame.
+        """
+        return MACD.macd_from_emas(
+            MovingAverages.ema(values, fast_ma),
+            MovingAverages.ema(values, slow_ma),
+            signal_line_period=signal_line_period,
+        )
+
     def compute_macd(self):
 
         ema_df = self.compute_ema(look_back_periods=[self.slow_ma, self.fast_ma])
         self.ticker_df = pd.concat([self.ticker_df, ema_df], axis=1)
-        self.ticker_df["macd_line"] = (
-            self.ticker_df[f"ema_{self.fast_ma}"]
-            - self.ticker_df[f"ema_{self.slow_ma}"]
+
+        macd_line, macd_signal = self.macd_from_emas(
+            ema_df[f"ema_{self.fast_ma}"],
+            ema_df[f"ema_{self.slow_ma}"],
+            signal_line_period=self.signal_line_period,
         )
-        self.ticker_df["macd_signal"] = self.compute_ema(
-            column="macd_line", look_back_periods=[self.signal_line_period]
+        self.ticker_df["macd_line"] = macd_line
+        self.ticker_df["macd_signal"] = macd_signal.astype(
+            self.output_dtype, copy=False
         )
         self.ticker_df["macd_histogram"] = (
             self.ticker_df["macd_line"] - self.ticker_df["macd_signal"]
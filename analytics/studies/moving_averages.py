@@ -1,11 +1,15 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import List
+from typing import List, TypeVar
 
+import numpy as np
 import pandas as pd
 
 from analytics.studies.data_definition import TickerData
 
+# a single price series or a (time x symbol/path) frame, windows run down every column
+PriceValues = TypeVar("PriceValues", pd.Series, pd.DataFrame)
+
 
 class MAModels(Enum):
     SMA: str = "SMA"
@@ -14,14 +18,27 @@ class MAModels(Enum):
 
 @dataclass
 class MovingAverages(TickerData):
+    @property
+    def output_dtype(self):
+        # pandas computes rolling/ewm windows in float64, compact inputs are cast back to float32
+        return np.float32 if self.compact else np.float64
+
+    @staticmethod
+    def sma(values: PriceValues, period: int) -> PriceValues:
+        return values.rolling(window=period).mean()
+
+    @staticmethod
+    def ema(values: PriceValues, period: int) -> PriceValues:
+        return values.ewm(span=period).mean()
+
     def compute_sma(
         self, column: str = "close", look_back_periods: List[int] = [5, 10, 20, 40]
     ):
         sma_dict = {}
         for n in look_back_periods:
-            sma_values = self.ticker_df[column].rolling(window=n).mean()
+            sma_values = self.sma(self.ticker_df[column], n)
             sma_values.fillna(self.ticker_df[column].astype(float), inplace=True)
-            sma_dict[f"ma_{n}"] = sma_values
+            sma_dict[f"ma_{n}"] = sma_values.astype(self.output_dtype, copy=False)
 
         return pd.DataFrame(sma_dict, index=self.ticker_df.index)
 
@@ -34,7 +51,7 @@ class MovingAverages(TickerData):
 
         ema_dict = {}
         for n in look_back_periods:
-            ema_values = self.ticker_df[column].ewm(span=n).mean()
-            ema_dict[f"ema_{n}"] = ema_values
+            ema_values = self.ema(self.ticker_df[column], n)
+            ema_dict[f"ema_{n}"] = ema_values.astype(self.output_dtype, copy=False)
 
         return pd.DataFrame(ema_dict, index=self.ticker_df.index)
@@ -9,47 +9,64 @@ from analytics.studies.data_definition import TickerData
 class RSIMethod(Enum):
     SMA: str = "sma"
     EWM: str = "ewm"
+    WILDER: str = "wilder"
 
 
 @dataclass
 class RSI(TickerData):
-    def compute_rsi(
-        self, span: int = 14, method: RSIMethod = RSIMethod.SMA
+    @staticmethod
+    def rsi_from_delta(
+        delta_close: pd.Series, span: int = 14, method: RSIMethod = RSIMethod.SMA
     ) -> pd.Series:
-
         """
-        Investopedia https://www.investopedia.com/terms/r/rsi.asp
-
-        Bascially,
-
-        RSI = 100 - (100/(1  - avg_up / abs(avg_down)))
+        smooth up and down moves of a precomputed close price delta.
 
-        avg_up -> avg of all up moves in the last N prices
-        avg_down -> avg of all down moves
+        Rows within the warm up window, the first `span` rows for every method, (or
+        without any price move) are left as NaN. Wilder smoothing is an EWM with
+        alpha = 1 / span.
         """
 
-        delta_close = self.ticker_df["close"].diff()
-
         delta_positive = delta_close.clip(lower=0)
         delta_negative = delta_close.clip(upper=0)
 
         if method.value == RSIMethod.SMA.value:
             delta_positive_rolling = delta_positive.rolling(window=span).mean()
             delta_negative_rolling = delta_negative.abs().rolling(window=span).mean()
-        elif method.value == RSIMethod.EWM.value:
+        elif method.value in [RSIMethod.EWM.value, RSIMethod.WILDER.value]:
+            alpha = (
+                1 / span if method.value == RSIMethod.WILDER.value else 2 / (span + 1)
+            )
             delta_positive_rolling = delta_positive.ewm(
-                adjust=False, ignore_na=True, alpha=2 / (span + 1)
+                adjust=False, ignore_na=True, alpha=alpha, min_periods=span
             ).mean()
             delta_negative_rolling = (
                 delta_negative.abs()
-                .ewm(adjust=False, ignore_na=True, alpha=2 / (span + 1))
+                .ewm(adjust=False, ignore_na=True, alpha=alpha, min_periods=span)
                 .mean()
             )
         else:
             raise ValueError(f"Method {method} not supported")
 
         relative_strength = delta_positive_rolling / delta_negative_rolling
-        relative_strength.fillna(0, inplace=True)
-        ticker_rsi = 100 - (100 / (1 + relative_strength))
+        return 100 - (100 / (1 + relative_strength))
+
+    def compute_rsi(
+        self, span: int = 14, method: RSIMethod = RSIMethod.SMA
+    ) -> pd.Series:
+        """
+        Investopedia https://www.investopedia.com/terms/r/rsi.asp
+
+        Bascially,
+
+        RSI = 100 - (100/(1  - avg_up / abs(avg_down)))
+
+        avg_up -> avg of all up moves in the last N prices
+        avg_down -> avg of all down moves
+        """
+
+        delta_close = self.ticker_df["close"].diff()
+
+        ticker_rsi = RSI.rsi_from_delta(delta_close, span=span, method=method)
+        ticker_rsi.fillna(0, inplace=True)
 
         return pd.DataFrame({"rsi": ticker_rsi})
@@ -0,0 +1,88 @@
+"""
+Stateful versions of the moving average studies for data that is fed in chunks.
+
+Every study keeps just enough state between chunks (the rolling window tail or the
+running EWM sums) so that the concatenated output matches the in-memory study.
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class StreamingSMA:
+    """
+    chunked `MovingAverages.compute_sma`, the warm up window falls back to the raw values.
+    """
+
+    period: int
+    tail: np.ndarray = field(default_factory=lambda: np.empty(0), init=False)
+
+    def update(self, values: np.ndarray) -> np.ndarray:
+
+        buffer = np.concatenate([self.tail, values])
+        sma_values = (
+            pd.Series(buffer)
+            .rolling(window=self.period)
+            .mean()
+            .values[len(self.tail) :]
+        )
+        sma_values = np.where(np.isnan(sma_values), values, sma_values)
+
+        # keep the last period - 1 values, the next chunk needs them to fill its first window
+        self.tail = buffer[max(len(buffer) - self.period + 1, 0) :]
+        return sma_values
+
+
+@dataclass
+class StreamingEMA:
+    """
+    chunked `MovingAverages.compute_ema`, i.e. pandas `ewm(span=period)` with adjust=True.
+
+    The adjusted EWM is a ratio of two exponentially decayed sums, both are carried over
+    and folded into the EWM of every new chunk.
+    """
+
+    period: int
+    weighted_sum: float = field(default=0.0, init=False)
+    weight_total: float = field(default=0.0, init=False)
+
+    def update(self, values: np.ndarray) -> np.ndarray:
+
+        alpha = 2 / (self.period + 1)
+        decay = 1 - alpha
+
+        chunk_ema = pd.Series(values).ewm(span=self.period).mean().values
+        decay_powers = decay ** np.arange(1, len(values) + 1)
+
+        # sum of the weights within the chunk and the contribution of earlier chunks
+        chunk_weights = (1 - decay_powers) / alpha
+        weighted_sum = chunk_ema * chunk_weights + decay_powers * self.weighted_sum
+        weight_total = chunk_weights + decay_powers * self.weight_total
+
+        self.weighted_sum, self.weight_total = weighted_sum[-1], weight_total[-1]
+        return weighted_sum / weight_total
+
+
+@dataclass
+class StreamingMACD:
+    """
+    chunked `MACD.compute_macd`, returns the macd line and the signal line.
+    """
+
+    slow_ma: int
+    fast_ma: int
+    signal_line_period: int
+
+    def __post_init__(self):
+        self.slow_ema = StreamingEMA(self.slow_ma)
+        self.fast_ema = StreamingEMA(self.fast_ma)
+        self.signal_ema = StreamingEMA(self.signal_line_period)
+
+    def update(self, values: np.ndarray):
+
+        macd_line = self.fast_ema.update(values) - self.slow_ema.update(values)
+        macd_signal = self.signal_ema.update(macd_line)
+        return macd_line, macd_signal
@@ -0,0 +1,157 @@
+import gzip
+import json
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+import pandas as pd
+from requests.exceptions import HTTPError
+
+from analytics.services.alpha_vantage import AVTimeseries
+from analytics.services.alpha_vantage_utils import OutputSize
+from analytics.services.transport import (
+    FixtureResponse,
+    FixtureServer,
+    RecordingTransport,
+    ReplayTransport,
+    Transport,
+)
+
+DAILY_ADJUSTED_RESPONSE = {
+    "Meta Data": {"2. Symbol": "IBM"},
+    "Time Series (Daily)": {
+        date: {
+            "1. open": str(100 + i),
+            "2. high": str(101 + i),
+            "3. low": str(99 + i),
+            "4. close": str(100.5 + i),
+            "5. adjusted close": str(100.5 + i),
+            "6. volume": str(1000 * (i + 1)),
+            "7. dividend amount": "0.0000",
+            "8. split coefficient": "1.0",
+        }
+        for i, date in enumerate(
+            pd.date_range(
+                pd.Timestamp.now().normalize(), periods=3, freq="-1D"
+            ).strftime("%Y-%m-%d")
+        )
+    },
+}
+
+
+class StubTransport(Transport):
+    """
+    stands in for the network while recording.
+    """
+
+    def __init__(self, payload=DAILY_ADJUSTED_RESPONSE, status_code=200):
+        self.n_calls = 0
+        self.payload = payload
+        self.status_code = status_code
+
+    def get(self, url, params, timeout):
+        self.n_calls += 1
+        return FixtureResponse(
+            status_code=self.status_code,
+            content=json.dumps(self.payload).encode("utf-8"),
+        )
+
+
+class TestAVTimeseriesTransport(TestCase):
+    def setUp(self) -> None:
+
+        self.fixtures_dir = tempfile.TemporaryDirectory()
+        self.stub = StubTransport()
+
+        recorder = AVTimeseries(
+            api_key="secret-key",
+            transport=RecordingTransport(self.fixtures_dir.name, transport=self.stub),
+        )
+        self.expected_df = recorder.get_daily_data("IBM", outputsize=OutputSize.FULL)
+
+    def tearDown(self) -> None:
+        self.fixtures_dir.cleanup()
+
+    def test_record__strips_api_key(self):
+
+        self.assertEqual(self.stub.n_calls, 1)
+        self.assertEqual(len(self.expected_df), 3)
+        fixture_paths = list(Path(self.fixtures_dir.name).iterdir())
+        self.assertEqual(len(fixture_paths), 1)
+        for fixture_path in fixture_paths:
+            with gzip.open(fixture_path, "rt") as fixture_file:
+                fixture = json.load(fixture_file)
+            self.assertNotIn("apikey", fixture["params"])
+            self.assertEqual(fixture["params"]["symbol"], "IBM")
+            self.assertNotIn("secret-key", json.dumps(fixture))
+
+    def test_record__skips_error_payloads(self):
+
+        fixture_path = next(Path(self.fixtures_dir.name).iterdir())
+        recorded = fixture_path.read_bytes()
+
+        for stub in [
+            StubTransport(payload={"Note": "rate limited"}),
+            StubTransport(payload={"Error Message": "invalid call"}),
+            StubTransport(payload={}, status_code=500),
+        ]:
+            recorder = AVTimeseries(
+                api_key="secret-key",
+                transport=RecordingTransport(self.fixtures_dir.name, transport=stub),
+            )
+            with self.assertRaises(HTTPError):
+                recorder.get_daily_data("IBM", outputsize=OutputSize.FULL)
+
+        # the good fixture is untouched
+        self.assertEqual(fixture_path.read_bytes(), recorded)
+
+    def test_replay__in_process(self):
+
+        av_obj = AVTimeseries(
+            api_key="another-key", transport=ReplayTransport(self.fixtures_dir.name)
+        )
+        pd.testing.assert_frame_equal(
+            av_obj.get_daily_data("IBM", outputsize=OutputSize.FULL), self.expected_df
+        )
+
+        with self.assertRaises(HTTPError):
+            # nothing was recorded for this symbol
+            av_obj.get_daily_data("MSFT", outputsize=OutputSize.FULL)
+
+    def test_replay__rate_limit(self):
+
+        av_obj = AVTimeseries(
+            api_key="another-key",
+            transport=ReplayTransport(self.fixtures_dir.name, calls_per_minute=2),
+        )
+        av_obj.get_daily_data("IBM", outputsize=OutputSize.FULL)
+        av_obj.get_daily_data("IBM", outputsize=OutputSize.FULL)
+
+        with self.assertRaises(HTTPError):
+            av_obj.get_daily_data("IBM", outputsize=OutputSize.FULL)
+
+    def test_replay__local_server(self):
+
+        with FixtureServer(ReplayTransport(self.fixtures_dir.name)) as server:
+            av_obj = AVTimeseries(api_key="another-key", base_url=server.url)
+            result_df = av_obj.get_daily_data("IBM", outputsize=OutputSize.FULL)
+
+        pd.testing.assert_frame_equal(result_df, self.expected_df)
+
+    def test_incomplete_transport__fails_on_creation(self):
+
+        class NoGetTransport(Transport):
+            pass
+
+        with self.assertRaises(TypeError):
+            NoGetTransport()
+
+    def test_daily_data__compact_requires_raw_prices(self):
+
+        av_obj = AVTimeseries(api_key="another-key", transport=self.stub)
+        with self.assertRaises(ValueError):
+            av_obj.get_daily_data("IBM", adjusted=True, compact=True)
+        self.assertEqual(self.stub.n_calls, 1)
+
+        compact_data = av_obj.get_daily_data("IBM", adjusted=False, compact=True)
+        self.assertEqual(len(compact_data), 3)
@@ -0,0 +1,96 @@
+from pathlib import Path
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from analytics.strategies.chunked import (
+    ChunkedCrossoverStrategy,
+    ChunkedMACDStrategy,
+    ChunkedMAStrategy,
+    read_csv_chunks,
+)
+from analytics.strategies.ma_crossovers import MAStrategy
+from analytics.strategies.macd_crossover import MACDCrossOverStrategy
+from analytics.studies.moving_averages import MovingAverages
+from analytics.studies.streaming import StreamingEMA, StreamingSMA
+
+MOCK_DATA_DIR = Path(__file__).parent / "mock_data"
+
+
+class TestChunkedEvaluation(TestCase):
+    def setUp(self) -> None:
+
+        self.sample_path = MOCK_DATA_DIR / "sample_data.csv"
+        self.sample_data = pd.read_csv(self.sample_path)
+        self.chunk_sizes = [1, 7, 33, 100, 1000]
+
+    def assert_same_sessions(self, result: pd.DataFrame, expected: pd.DataFrame):
+
+        self.assertListEqual(list(result.index), list(expected.index))
+        self.assertListEqual(
+            list(result["session_details"]), list(expected["session_details"])
+        )
+        np.testing.assert_allclose(
+            result["percent_returns"].values,
+            expected["percent_returns"].values.astype(float),
+        )
+
+    def test_streaming_studies__match_in_memory(self):
+
+        ma_df = MovingAverages(ticker_df=self.sample_data).compute_sma(
+            look_back_periods=[20]
+        )
+        ema_df = MovingAverages(ticker_df=self.sample_data).compute_ema(
+            look_back_periods=[20]
+        )
+
+        for chunk_size in self.chunk_sizes:
+            sma, ema = StreamingSMA(20), StreamingEMA(20)
+            sma_values, ema_values = [], []
+            for chunk in read_csv_chunks(self.sample_path, chunksize=chunk_size):
+                sma_values.append(sma.update(chunk["close"].values))
+                ema_values.append(ema.update(chunk["close"].values))
+
+            np.testing.assert_allclose(np.concatenate(sma_values), ma_df["ma_20"])
+            np.testing.assert_allclose(np.concatenate(ema_values), ema_df["ema_20"])
+
+    def test_ma_crossover__matches_in_memory(self):
+
+        expected = MAStrategy.evaluate_ma_crossover(
+            self.sample_data, slow_ma=20, fast_ma=10
+        )
+        for chunk_size in self.chunk_sizes:
+            result = ChunkedMAStrategy.evaluate_ma_crossover(
+                read_csv_chunks(self.sample_path, chunksize=chunk_size),
+                slow_ma=20,
+                fast_ma=10,
+            )
+            self.assert_same_sessions(result, expected)
+
+    def test_macd_crossover__matches_in_memory(self):
+
+        expected = MACDCrossOverStrategy.evaluate_macd_crossover(
+            self.sample_data, slow_ma=26, fast_ma=12, signal_line_period=9
+        )
+        for chunk_size in self.chunk_sizes:
+            result = ChunkedMACDStrategy.evaluate_macd_crossover(
+                read_csv_chunks(self.sample_path, chunksize=chunk_size),
+                slow_ma=26,
+                fast_ma=12,
+                signal_line_period=9,
+            )
+            self.assert_same_sessions(result, expected)
+            self.assertListEqual(
+                list(result["number_of_sessions"]),
+                list(expected["number_of_sessions"]),
+            )
+
+    def test_incomplete_strategy__fails_on_creation(self):
+
+        class NoSignalStrategy(ChunkedCrossoverStrategy):
+            session_column = "session"
+            label_column = "label"
+
+        with self.assertRaises(TypeError):
+            NoSignalStrategy()
@@ -0,0 +1,67 @@
+from pathlib import Path
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from analytics.strategies.ma_crossovers import MAStrategy
+from analytics.strategies.macd_crossover import MACDCrossOverStrategy
+from analytics.studies.data_definition import CompactOHLCV
+
+MOCK_DATA_DIR = Path(__file__).parent / "mock_data"
+
+
+class TestCompactMode(TestCase):
+    def setUp(self) -> None:
+
+        self.sample_data = pd.read_csv(MOCK_DATA_DIR / "sample_data.csv")
+        self.compact_data = CompactOHLCV.from_frame(self.sample_data)
+
+    def test_compact_ohlcv__dtypes(self):
+
+        self.assertEqual(self.compact_data.close.dtype, np.float32)
+        self.assertEqual(self.compact_data.volume.dtype, np.int64)
+        self.assertEqual(len(self.compact_data), len(self.sample_data))
+        self.assertLess(
+            self.compact_data.nbytes,
+            self.sample_data.memory_usage(index=False).sum(),
+        )
+
+    def test_ma_sessions__compact_columns(self):
+
+        ma_df = MAStrategy(
+            ticker_df=self.compact_data, slow_ma=20, fast_ma=10
+        ).ma_sessions()
+
+        self.assertEqual(ma_df["ma_20"].dtype, np.float32)
+        self.assertEqual(ma_df["ma_session_20_10"].dtype, np.int32)
+        self.assertEqual(ma_df["label_20_10"].dtype.name, "category")
+        self.assertEqual(ma_df["label_20_10"].cat.codes.dtype, np.int8)
+
+    def test_evaluate_ma_crossover__matches_regular_mode(self):
+
+        expected = MAStrategy.evaluate_ma_crossover(self.sample_data)
+        result = MAStrategy.evaluate_ma_crossover(self.compact_data)
+
+        self.assertEqual(len(expected), len(result))
+        np.testing.assert_allclose(
+            result["percent_returns"].values.astype(float),
+            expected["percent_returns"].values.astype(float),
+            atol=1e-4,
+        )
+
+    def test_evaluate_macd_crossover__matches_regular_mode(self):
+
+        expected = MACDCrossOverStrategy.evaluate_macd_crossover(
+            self.sample_data, slow_ma=26, fast_ma=12, signal_line_period=9
+        )
+        result = MACDCrossOverStrategy.evaluate_macd_crossover(
+            self.compact_data, slow_ma=26, fast_ma=12, signal_line_period=9
+        )
+
+        self.assertEqual(len(expected), len(result))
+        np.testing.assert_allclose(
+            result["percent_returns"].values.astype(float),
+            expected["percent_returns"].values.astype(float),
+            atol=1e-4,
+        )
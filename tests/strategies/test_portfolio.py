@@ -0,0 +1,112 @@
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from analytics.strategies.portfolio import (
+    CrossSectionalStrategy,
+    RankingScore,
+    RebalanceFrequency,
+)
+from analytics.studies.corporate_actions import to_panel
+from analytics.studies.macd import MACD
+
+
+class TestCrossSectionalStrategy(TestCase):
+    def setUp(self) -> None:
+
+        rng = np.random.default_rng(3)
+        n_rows, n_symbols = 300, 12
+        self.close_df = pd.DataFrame(
+            100 * np.exp(np.cumsum(rng.normal(0, 0.02, (n_rows, n_symbols)), axis=0)),
+            index=pd.bdate_range("2020-01-01", periods=n_rows),
+            columns=[f"SYM{i}" for i in range(n_symbols)],
+        )
+        # a late listing
+        self.close_df.iloc[:120, 0] = np.nan
+
+    def reference_equity(self, strategy, result) -> np.ndarray:
+        """
+        bar by bar simulation of the same portfolio.
+        """
+        close_prices = self.close_df.values
+        rows = list(strategy.rebalance_rows(self.close_df.index))
+
+        equity, holdings, cash = 1.0, np.zeros(close_prices.shape[1]), 1.0
+        equity_curve = []
+        for t in range(len(close_prices)):
+            if t > 0:
+                bar_returns = np.nan_to_num(close_prices[t] / close_prices[t - 1] - 1)
+                holdings = holdings * (1 + bar_returns)
+                equity = cash + holdings.sum()
+            equity_curve.append(equity)
+            if t in rows:
+                weights = result.weights.values[rows.index(t)]
+                turnover = np.abs(weights - holdings / equity).sum()
+                equity *= 1 - turnover * strategy.cost_bps / 10000
+                holdings = weights * equity
+                cash = equity - holdings.sum()
+        return np.array(equity_curve)
+
+    def test_backtest__matches_reference(self):
+
+        for score in RankingScore:
+            strategy = CrossSectionalStrategy(
+                score=score,
+                top_n=3,
+                frequency=RebalanceFrequency.WEEKLY,
+                cost_bps=25,
+                ma_period=20,
+            )
+            result = strategy.backtest(self.close_df)
+
+            np.testing.assert_allclose(
+                result.equity_curve.values, self.reference_equity(strategy, result)
+            )
+
+    def test_compute_scores__macd_matches_study(self):
+
+        strategy = CrossSectionalStrategy(score=RankingScore.MACD_HISTOGRAM)
+        scores = strategy.compute_scores(self.close_df)
+
+        ticker_df = self.close_df[["SYM1"]].rename(columns={"SYM1": "close"})
+        macd_df = MACD(
+            ticker_df=ticker_df,
+            slow_ma=strategy.slow_ma,
+            fast_ma=strategy.fast_ma,
+            signal_line_period=strategy.signal_line_period,
+        ).compute_macd()
+
+        np.testing.assert_allclose(
+            scores["SYM1"], macd_df["macd_histogram"] / ticker_df["close"]
+        )
+
+    def test_select_top_n(self):
+
+        strategy = CrossSectionalStrategy(
+            score=RankingScore.RSI, top_n=3, ascending=True, rebalance_every=20
+        )
+        result = strategy.backtest(self.close_df)
+        scores = strategy.compute_scores(self.close_df).loc[result.weights.index]
+
+        for date, weights in result.weights.iterrows():
+            expected = scores.loc[date].dropna().nsmallest(3).index
+            self.assertSetEqual(set(weights[weights > 0].index), set(expected))
+            self.assertAlmostEqual(weights.sum(), 1.0 if len(expected) else 0.0)
+
+    def test_panel_input(self):
+
+        panel = to_panel(
+            {
+                symbol: pd.DataFrame({"close": self.close_df[symbol]}).rename_axis(
+                    "date"
+                )
+                for symbol in self.close_df.columns
+            }
+        )
+        from_panel = CrossSectionalStrategy.evaluate_portfolio(panel, top_n=3)
+        from_wide = CrossSectionalStrategy.evaluate_portfolio(self.close_df, top_n=3)
+
+        np.testing.assert_allclose(
+            from_panel.equity_curve.values, from_wide.equity_curve.values
+        )
@@ -0,0 +1,75 @@
+from pathlib import Path
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from analytics.strategies.ma_crossovers import MAStrategy
+from analytics.strategies.macd_crossover import MACDCrossOverStrategy
+from analytics.strategies.robustness import (
+    MACDCrossoverSignal,
+    MACrossoverSignal,
+    ResampleMethod,
+    RobustnessEngine,
+    evaluate_paths,
+)
+
+MOCK_DATA_DIR = Path(__file__).parent / "mock_data"
+
+
+class TestRobustnessEngine(TestCase):
+    def setUp(self) -> None:
+
+        self.sample_data = pd.read_csv(MOCK_DATA_DIR / "sample_data.csv")
+        self.session_returns = MAStrategy.evaluate_ma_crossover(self.sample_data)
+
+    def test_evaluate_paths__matches_strategies(self):
+
+        open_paths = self.sample_data[["open"]].values
+        close_paths = self.sample_data[["close"]].values
+
+        ma_returns = evaluate_paths(open_paths, close_paths, MACrossoverSignal(20, 10))
+        np.testing.assert_allclose(
+            ma_returns[0], self.session_returns["percent_returns"].values.astype(float)
+        )
+
+        macd_returns = evaluate_paths(
+            open_paths, close_paths, MACDCrossoverSignal(26, 12, 9)
+        )
+        expected = MACDCrossOverStrategy.evaluate_macd_crossover(
+            self.sample_data, slow_ma=26, fast_ma=12, signal_line_period=9
+        )
+        np.testing.assert_allclose(
+            macd_returns[0], expected["percent_returns"].values.astype(float)
+        )
+
+    def test_resample_sessions__shuffle_keeps_totals(self):
+
+        engine = RobustnessEngine(n_resamples=500, seed=7, batch_size=200)
+        metrics = engine.resample_sessions(self.session_returns)
+
+        self.assertEqual(len(metrics), 500)
+        np.testing.assert_allclose(
+            metrics["compounded_percent_returns"],
+            metrics["compounded_percent_returns"].iloc[0],
+        )
+        self.assertTrue((metrics["max_drawdown_percent"] <= 0).all())
+
+    def test_bootstrap__reproducible_across_jobs(self):
+
+        kwargs = dict(n_resamples=300, seed=11, batch_size=100)
+        serial = RobustnessEngine(**kwargs).bootstrap_prices(
+            self.sample_data, MACrossoverSignal(20, 10), block_size=10
+        )
+        parallel = RobustnessEngine(n_jobs=2, **kwargs).bootstrap_prices(
+            self.sample_data, MACrossoverSignal(20, 10), block_size=10
+        )
+
+        pd.testing.assert_frame_equal(serial, parallel)
+        self.assertEqual(len(serial), 300)
+
+        resampled = RobustnessEngine(**kwargs).resample_sessions(
+            self.session_returns, method=ResampleMethod.BOOTSTRAP
+        )
+        intervals = RobustnessEngine.confidence_intervals(resampled)
+        self.assertListEqual(list(intervals.index), [0.05, 0.5, 0.95])
@@ -0,0 +1,107 @@
+from pathlib import Path
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from analytics.strategies.rsi_strategy import RSIStrategy
+from analytics.strategies.utils import Trend
+from analytics.studies.rsi import RSI, RSIMethod
+
+MOCK_DATA_DIR = Path(__file__).parent / "mock_data"
+
+
+class TestRSIStrategy(TestCase):
+    def setUp(self) -> None:
+
+        self.sample_data = pd.read_csv(MOCK_DATA_DIR / "sample_data.csv")
+
+        # define happy_path variables
+        self.spans = [7, 14]
+        self.thresholds = [(30, 70), (40, 60), (45, 55)]
+
+    def test_wilder_smoothing(self):
+
+        rsi_df = RSI(ticker_df=self.sample_data).compute_rsi(
+            span=14, method=RSIMethod.WILDER
+        )
+
+        delta_close = self.sample_data["close"].diff()
+        avg_up = delta_close.clip(lower=0).ewm(alpha=1 / 14, adjust=False).mean()
+        avg_down = (
+            delta_close.clip(upper=0).abs().ewm(alpha=1 / 14, adjust=False).mean()
+        )
+        expected = 100 - 100 / (1 + avg_up / avg_down)
+
+        # the warm up window is filled with 0
+        np.testing.assert_array_equal(rsi_df["rsi"].values[:14], 0)
+        np.testing.assert_allclose(
+            rsi_df["rsi"].values[14:], expected.values[14:], rtol=1e-10
+        )
+
+    def test_rsi_sessions__no_session_within_warm_up(self):
+
+        for method in RSIMethod:
+            rsi_df = RSIStrategy(
+                ticker_df=self.sample_data,
+                span=14,
+                oversold=45,
+                overbought=55,
+                method=method,
+            ).rsi_sessions()
+
+            self.assertTrue(rsi_df["label_14_45_55"].iloc[:14].isna().all())
+            self.assertTrue(rsi_df["label_14_45_55"].iloc[14:].notna().any())
+
+    def test_rsi_sessions__happy_path(self):
+
+        rsi_df = RSIStrategy(
+            ticker_df=self.sample_data, span=14, oversold=40, overbought=60
+        ).rsi_sessions()
+
+        column_suffix = "14_40_60"
+        expected_columns = [
+            f"{col}_{column_suffix}" for col in ["rsi_signal", "rsi_session", "label"]
+        ]
+        self.assertTrue(set(expected_columns).issubset(rsi_df.columns))
+        self.assertTrue(
+            set(rsi_df[f"label_{column_suffix}"].dropna()).issubset(
+                {"bullish", "bearish"}
+            )
+        )
+
+    def test_rsi_strategy__fails_validation(self):
+
+        with self.assertRaises(AssertionError):
+            # oversold must always be lower than overbought
+            RSIStrategy(ticker_df=self.sample_data, oversold=70, overbought=30)
+
+    def test_sweep__matches_evaluate_rsi(self):
+
+        for trend_ma, capture_trend in [(None, Trend.ALL), (20, Trend.BULLISH)]:
+            sweep_df = RSIStrategy.sweep_rsi_thresholds(
+                self.sample_data,
+                spans=self.spans,
+                thresholds=self.thresholds,
+                trend_ma=trend_ma,
+                capture_trend=capture_trend,
+            )
+            self.assertEqual(len(sweep_df), len(self.spans) * len(self.thresholds))
+
+            for span in self.spans:
+                for oversold, overbought in self.thresholds:
+                    returns_df = RSIStrategy.evaluate_rsi(
+                        self.sample_data,
+                        span=span,
+                        oversold=oversold,
+                        overbought=overbought,
+                        trend_ma=trend_ma,
+                        capture_trend=capture_trend,
+                    )
+                    result = sweep_df.loc[(span, oversold, overbought)]
+
+                    self.assertEqual(result["number_of_sessions"], len(returns_df))
+                    self.assertAlmostEqual(
+                        result["total_percent_returns"],
+                        returns_df["percent_returns"].sum() if len(returns_df) else 0,
+                    )
@@ -0,0 +1,122 @@
+from pathlib import Path
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from analytics.strategies.ma_crossovers import MAStrategy
+from analytics.strategies.macd_crossover import MACDCrossOverStrategy
+from analytics.strategies.signal_strategy import SignalStrategy
+from analytics.strategies.signals import (
+    SMA,
+    MACDValue,
+    Price,
+    RSIValue,
+    compile_signals,
+    crosses_above,
+    crosses_below,
+    hold,
+    hold_for,
+)
+
+MOCK_DATA_DIR = Path(__file__).parent / "mock_data"
+
+
+class TestSignalStrategy(TestCase):
+    def setUp(self) -> None:
+
+        self.sample_data = pd.read_csv(MOCK_DATA_DIR / "sample_data.csv")
+        self.toy_data = pd.DataFrame(
+            {"open": [1.0, 3, 5, 2, 1, 4], "close": [1.0, 3, 5, 2, 1, 4]}
+        )
+
+    def test_plan__deduplicates_indicators(self):
+
+        plan = compile_signals(
+            {
+                "ma": SMA(10) > SMA(20),
+                "trend": (Price() > SMA(20)) & (RSIValue(14) < 70),
+                "ma_again": SMA(10) > SMA(20),
+            }
+        )
+
+        self.assertEqual(
+            sorted(map(repr, plan.indicators)),
+            sorted(map(repr, [SMA(10), SMA(20), Price(), RSIValue(14)])),
+        )
+
+    def test_ma_signal__matches_ma_strategy(self):
+
+        expected = MAStrategy.evaluate_ma_crossover(
+            self.sample_data, slow_ma=20, fast_ma=10
+        )
+        result = SignalStrategy.evaluate_signal(self.sample_data, SMA(10) > SMA(20))
+
+        np.testing.assert_allclose(
+            result["percent_returns"].values,
+            expected["percent_returns"].values.astype(float),
+        )
+        self.assertListEqual(
+            list(result.index.get_level_values(1)),
+            list(expected.index.get_level_values(1)),
+        )
+
+    def test_macd_signal__matches_macd_strategy(self):
+
+        expected = MACDCrossOverStrategy.evaluate_macd_crossover(
+            self.sample_data, slow_ma=26, fast_ma=12, signal_line_period=9
+        )
+        result = SignalStrategy.evaluate_signal(
+            self.sample_data,
+            MACDValue(26, 12, 9) > MACDValue(26, 12, 9, "macd_signal"),
+        )
+
+        np.testing.assert_allclose(
+            result["percent_returns"].values,
+            expected["percent_returns"].values.astype(float),
+        )
+
+    def test_crosses_and_holding_rules(self):
+
+        plan = compile_signals(
+            {
+                "up": crosses_above(Price(), 2.5),
+                "down": crosses_below(Price(), 2.5),
+                "hold": hold(crosses_above(Price(), 2.5), crosses_below(Price(), 1.5)),
+                "hold_for": hold_for(crosses_above(Price(), 2.5), bars=2),
+            }
+        )
+        result = plan.evaluate(self.toy_data)
+
+        self.assertListEqual(
+            list(result["up"]), [False, True, False, False, False, True]
+        )
+        self.assertListEqual(
+            list(result["down"]), [False, False, False, True, False, False]
+        )
+        self.assertListEqual(
+            list(result["hold"]), [False, True, True, True, False, True]
+        )
+        self.assertListEqual(
+            list(result["hold_for"]), [False, True, True, False, False, True]
+        )
+
+    def test_signal_sessions__happy_path(self):
+
+        signal_df = SignalStrategy(
+            ticker_df=self.sample_data, signal=SMA(10) > SMA(20), name="ma"
+        ).signal_sessions()
+
+        expected_columns = ["signal_ma", "signal_session_ma", "label_ma"]
+        self.assertTrue(set(expected_columns).issubset(signal_df.columns))
+
+    def test_session_returns__empty_input(self):
+
+        result = SignalStrategy.evaluate_signal(
+            self.sample_data.iloc[:0], signal=SMA(10) > SMA(20)
+        )
+
+        self.assertEqual(len(result), 0)
+        self.assertListEqual(
+            list(result.columns), ["percent_returns", "session_details"]
+        )
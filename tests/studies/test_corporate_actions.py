@@ -0,0 +1,145 @@
+from pathlib import Path
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from analytics.services.nse import read_nse_csv
+from analytics.studies.corporate_actions import (
+    CorporateActionAdjuster,
+    events_from_daily_adjusted,
+    to_panel,
+)
+
+DATA_DIR = Path(__file__).parents[2] / "data"
+
+
+class TestCorporateActions(TestCase):
+    def setUp(self) -> None:
+
+        self.ticker_df = read_nse_csv(
+            DATA_DIR / "15-08-2019-TO-13-08-2020ICICIBANKEQN.csv"
+        )
+        self.split_date = self.ticker_df.index[100]
+        self.dividend_date = self.ticker_df.index[200]
+
+        # simulate a 2:1 split by halving prices and doubling volume from the ex-date on
+        self.split_df = self.ticker_df.copy()
+        after_split = self.split_df.index >= self.split_date
+        self.split_df.loc[after_split, ["open", "high", "low", "close"]] /= 2
+        self.split_df.loc[after_split, "volume"] *= 2
+
+        self.events_df = pd.DataFrame(
+            {
+                "symbol": ["ICICIBANK", "ICICIBANK"],
+                "date": [self.split_date, self.dividend_date],
+                "split_ratio": [2.0, 1.0],
+                "dividend": [0.0, 2.0],
+            }
+        )
+
+    def test_adjust__removes_split(self):
+
+        adjusted_df = CorporateActionAdjuster().adjust(
+            self.split_df, self.events_df.iloc[:1], symbol="ICICIBANK"
+        )
+
+        np.testing.assert_allclose(adjusted_df["close"], self.ticker_df["close"] / 2)
+        np.testing.assert_allclose(adjusted_df["volume"], self.ticker_df["volume"] * 2)
+
+    def test_adjust__dividend_factor(self):
+
+        adjusted_df = CorporateActionAdjuster().adjust(
+            self.split_df, self.events_df, symbol="ICICIBANK"
+        )
+
+        previous_close = self.split_df["close"].iloc[199]
+        expected_factor = 1 - 2.0 / previous_close
+        before_dividend = adjusted_df.index < self.dividend_date
+
+        np.testing.assert_allclose(
+            adjusted_df.loc[before_dividend, "close"],
+            self.ticker_df.loc[before_dividend, "close"] / 2 * expected_factor,
+        )
+        np.testing.assert_allclose(
+            adjusted_df.loc[~before_dividend, "close"],
+            self.split_df.loc[~before_dividend, "close"],
+        )
+
+    def test_adjust_panel__incremental_matches_full(self):
+
+        panel = to_panel({"ICICIBANK": self.split_df, "OTHER": self.ticker_df})
+        expected = CorporateActionAdjuster().adjust_panel(panel, self.events_df)
+
+        # first pass only sees data before the dividend, the second pass adds new bars
+        adjuster = CorporateActionAdjuster()
+        history = panel.loc[panel.index.get_level_values("date") < self.dividend_date]
+        adjuster.adjust_panel(history, self.events_df)
+        self.assertEqual(len(adjuster.cache.factors), 1)
+
+        new_bars = panel.loc[panel.index.get_level_values("date") >= self.dividend_date]
+        adjuster.adjust_panel(new_bars, self.events_df)
+        self.assertEqual(len(adjuster.cache.factors), 2)
+
+        pd.testing.assert_frame_equal(
+            adjuster.adjust_panel(panel, self.events_df), expected
+        )
+        pd.testing.assert_frame_equal(
+            expected.loc["OTHER"], self.ticker_df, check_names=False
+        )
+
+    def test_adjust__no_events(self):
+
+        events_df = pd.DataFrame(columns=["symbol", "date", "split_ratio", "dividend"])
+
+        adjusted_df = CorporateActionAdjuster().adjust(
+            self.ticker_df, events_df, symbol="ICICIBANK"
+        )
+
+        pd.testing.assert_frame_equal(adjusted_df, self.ticker_df, check_names=False)
+
+    def test_adjust__only_future_events(self):
+
+        events_df = self.events_df.assign(
+            date=self.ticker_df.index[-1] + pd.Timedelta(days=30)
+        ).iloc[:1]
+
+        adjusted_df = CorporateActionAdjuster().adjust(
+            self.ticker_df, events_df, symbol="ICICIBANK"
+        )
+
+        pd.testing.assert_frame_equal(adjusted_df, self.ticker_df, check_names=False)
+
+    def test_adjust_panel__late_event_inside_history(self):
+
+        panel = to_panel({"ICICIBANK": self.split_df})
+        expected = CorporateActionAdjuster().adjust_panel(panel, self.events_df)
+
+        # the dividend is only learned after its ex-date was already seen
+        adjuster = CorporateActionAdjuster()
+        adjuster.adjust_panel(panel, self.events_df.iloc[:1])
+
+        # new bars alone cannot price it, it is not cached with a wrong factor
+        adjuster.adjust_panel(panel.iloc[-1:], self.events_df)
+        self.assertEqual(len(adjuster.cache.factors), 1)
+
+        # a panel covering the close before the ex-date prices it
+        pd.testing.assert_frame_equal(
+            adjuster.adjust_panel(panel, self.events_df), expected
+        )
+        self.assertEqual(len(adjuster.cache.factors), 2)
+
+    def test_events_from_daily_adjusted(self):
+
+        daily_df = self.split_df.assign(
+            **{"dividend amount": 0.0, "split coefficient": 1.0}
+        )
+        daily_df.loc[self.split_date, "split coefficient"] = 2.0
+        daily_df.loc[self.dividend_date, "dividend amount"] = 2.0
+
+        events_df = events_from_daily_adjusted(daily_df, symbol="ICICIBANK")
+
+        self.assertListEqual(
+            list(events_df["date"]), [self.split_date, self.dividend_date]
+        )
+        self.assertListEqual(list(events_df["split_ratio"]), [2.0, 1.0])
@@ -0,0 +1,112 @@
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+import pandas as pd
+
+from analytics import cli
+
+REPO_DIR = Path(__file__).parent.parent
+MOCK_DATA_DIR = Path(__file__).parent / "strategies" / "mock_data"
+
+
+class TestCLI(TestCase):
+    def setUp(self) -> None:
+
+        self.cache_dir = tempfile.TemporaryDirectory()
+
+        sample_data = pd.read_csv(MOCK_DATA_DIR / "sample_data.csv")
+        sample_data.index = pd.date_range("2020-01-01", periods=len(sample_data))
+        for symbol in ["AAA", "BBB"]:
+            sample_data.to_csv(cli.cache_path(self.cache_dir.name, symbol, "daily"))
+
+    def tearDown(self) -> None:
+        self.cache_dir.cleanup()
+
+    def test_help__does_not_import_heavy_modules(self):
+
+        code = (
+            "import sys; from analytics import cli; cli.build_parser().format_help(); "
+            "print(sorted({'pandas', 'numpy', 'requests'} & set(sys.modules)))"
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=REPO_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(completed.stdout.strip(), "[]")
+
+    def test_run(self):
+
+        output = Path(self.cache_dir.name) / "results" / "rsi.csv"
+        exit_code = cli.main(
+            [
+                "run",
+                "--symbols",
+                "AAA",
+                "BBB",
+                "--strategy",
+                "rsi",
+                "--cache-dir",
+                self.cache_dir.name,
+                "--output",
+                str(output),
+            ]
+        )
+        self.assertEqual(exit_code, 0)
+
+        result_df = pd.read_csv(output, index_col=[0, 1])
+        self.assertEqual(
+            set(result_df.index.get_level_values("symbol")), {"AAA", "BBB"}
+        )
+        self.assertIn("percent_returns", result_df.columns)
+        self.assertEqual(set(result_df["label"]), {"bullish", "bearish"})
+
+    def test_sweep__universe_file(self):
+
+        universe = Path(self.cache_dir.name) / "universe.txt"
+        universe.write_text("AAA\nBBB\n")
+        output = Path(self.cache_dir.name) / "sweep.csv"
+
+        exit_code = cli.main(
+            [
+                "sweep",
+                "--universe",
+                str(universe),
+                "--slow-ma",
+                "20",
+                "50",
+                "--fast-ma",
+                "5",
+                "10",
+                "--cache-dir",
+                self.cache_dir.name,
+                "--output",
+                str(output),
+            ]
+        )
+        self.assertEqual(exit_code, 0)
+
+        sweep_df = pd.read_csv(output, index_col=[0, 1])
+        self.assertEqual(len(sweep_df), 2 * 4)
+        self.assertTrue((sweep_df["number_of_sessions"] > 0).all())
+
+    def test_fetch__skips_cached_symbols(self):
+
+        # nothing is requested for cached symbols, replaying from an empty directory is fine
+        exit_code = cli.main(
+            [
+                "fetch",
+                "--symbols",
+                "AAA",
+                "--cache-dir",
+                self.cache_dir.name,
+                "--replay",
+                self.cache_dir.name,
+            ]
+        )
+        self.assertEqual(exit_code, 0)